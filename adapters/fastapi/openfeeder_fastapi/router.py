@@ -217,8 +217,12 @@ def openfeeder_router(
             if item is None:
                 return _error_response("NOT_FOUND", "No item found at the given URL.", 404)
 
-            chunks_raw = chunk_content(item.get("content", ""), item.get("url", normalized_url))
-            summary = summarise(item.get("content", ""))
+            # Items may carry precomputed chunks/summary (e.g. built once at
+            # startup); fall back to chunking the raw content per request
+            chunks_raw = item.get("_chunks")
+            if chunks_raw is None:
+                chunks_raw = chunk_content(item.get("content", ""), item.get("url", normalized_url))
+            summary = item.get("_summary") or summarise(item.get("content", ""))
 
             body = {
                 "schema": "openfeeder/1.0",
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
 
 import httpx
 
@@ -29,6 +30,9 @@ BOT_FAMILIES = {
 }
 
 
+# Cached: runs on every request and the set of distinct UAs seen in
+# practice is small, so repeat lookups skip the substring scan entirely
+@lru_cache(maxsize=4096)
 def detect_bot(user_agent: str) -> tuple[str, str]:
     """Return (bot_name, bot_family) from a User-Agent string."""
     if not user_agent:
@@ -10,6 +10,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 # Bot detection patterns
@@ -30,6 +31,9 @@ BOT_FAMILIES = {
 }
 
 
+# Cached: runs on every request and the set of distinct UAs seen in
+# practice is small, so repeat lookups skip the substring scan entirely
+@lru_cache(maxsize=4096)
 def detect_bot(user_agent: str) -> tuple[str, str]:
     """Return (bot_name, bot_family) from a User-Agent string."""
     if not user_agent:
@@ -27,6 +27,7 @@ Configuration via environment variables:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -69,6 +70,11 @@ class AnalyticsService:
         self.providers = providers or []
         self.enabled = len([p for p in self.providers if p.enabled]) > 0
 
+        # Background dispatch queue (started via start(); inline until then)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dropped = 0
+
         if self.enabled:
             enabled_count = len([p for p in self.providers if p.enabled])
             logger.info("Analytics service initialized with %d enabled provider(s)", enabled_count)
@@ -237,105 +243,104 @@ class AnalyticsService:
 
         return AnalyticsService(providers)
 
-    async def track_api_request(self, event: APIRequestEvent) -> None:
-        """Track an API request to all enabled providers."""
-        if not self.enabled:
-            return
+    def start(self, queue_size: int = 10000) -> None:
+        """
+        Start the background dispatch worker (requires a running event loop).
 
+        Once started, track_* calls enqueue events and return immediately
+        instead of awaiting each provider's outbound HTTP request on the
+        request critical path. When the queue is full, events are dropped
+        and counted. Until start() is called, dispatch happens inline.
+        """
+        if self.enabled and self._worker is None:
+            self._queue = asyncio.Queue(maxsize=queue_size)
+            self._worker = asyncio.create_task(self._dispatch_loop())
+            logger.info("Analytics background dispatch started (queue size %d)", queue_size)
+
+    async def _dispatch_loop(self) -> None:
+        """Consume queued events and forward them to providers."""
+        while True:
+            method, event = await self._queue.get()
+            try:
+                await self._dispatch(method, event)
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch(self, method: str, event: Any) -> None:
+        """Forward one event to every enabled provider."""
         for provider in self.providers:
             if provider.enabled:
                 try:
-                    await provider.track_api_request(event)
+                    await getattr(provider, method)(event)
                 except Exception as e:
                     logger.debug(
-                        "Error tracking API request in %s: %s",
+                        "Error in %s.%s: %s",
                         provider.provider_name,
+                        method,
                         e,
                     )
 
-    async def track_search(self, event: SearchEvent) -> None:
-        """Track a search event to all enabled providers."""
+    async def _track(self, method: str, event: Any) -> None:
+        """Enqueue an event for background dispatch, or dispatch inline."""
         if not self.enabled:
             return
 
-        for provider in self.providers:
-            if provider.enabled:
-                try:
-                    await provider.track_search(event)
-                except Exception as e:
-                    logger.debug(
-                        "Error tracking search in %s: %s",
-                        provider.provider_name,
-                        e,
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait((method, event))
+            except asyncio.QueueFull:
+                self._dropped += 1
+                if self._dropped % 100 == 1:
+                    logger.warning(
+                        "Analytics queue full — %d event(s) dropped so far",
+                        self._dropped,
                     )
+            return
+
+        await self._dispatch(method, event)
+
+    async def track_api_request(self, event: APIRequestEvent) -> None:
+        """Track an API request to all enabled providers."""
+        await self._track("track_api_request", event)
+
+    async def track_search(self, event: SearchEvent) -> None:
+        """Track a search event to all enabled providers."""
+        await self._track("track_search", event)
 
     async def track_sync(self, event: SyncEvent) -> None:
         """Track a differential sync event to all enabled providers."""
-        if not self.enabled:
-            return
-
-        for provider in self.providers:
-            if provider.enabled:
-                try:
-                    await provider.track_sync(event)
-                except Exception as e:
-                    logger.debug(
-                        "Error tracking sync in %s: %s",
-                        provider.provider_name,
-                        e,
-                    )
+        await self._track("track_sync", event)
 
     async def track_bot_activity(self, event: BotActivityEvent) -> None:
         """Track bot activity to all enabled providers."""
-        if not self.enabled:
-            return
-
-        for provider in self.providers:
-            if provider.enabled:
-                try:
-                    await provider.track_bot_activity(event)
-                except Exception as e:
-                    logger.debug(
-                        "Error tracking bot activity in %s: %s",
-                        provider.provider_name,
-                        e,
-                    )
+        await self._track("track_bot_activity", event)
 
     async def track_rate_limit(self, event: RateLimitEvent) -> None:
         """Track a rate limit violation to all enabled providers."""
-        if not self.enabled:
-            return
-
-        for provider in self.providers:
-            if provider.enabled:
-                try:
-                    await provider.track_rate_limit(event)
-                except Exception as e:
-                    logger.debug(
-                        "Error tracking rate limit in %s: %s",
-                        provider.provider_name,
-                        e,
-                    )
+        await self._track("track_rate_limit", event)
 
     async def track_error(self, event: ErrorEvent) -> None:
         """Track an error to all enabled providers."""
-        if not self.enabled:
-            return
-
-        for provider in self.providers:
-            if provider.enabled:
-                try:
-                    await provider.track_error(event)
-                except Exception as e:
-                    logger.debug(
-                        "Error tracking error in %s: %s",
-                        provider.provider_name,
-                        e,
-                    )
+        await self._track("track_error", event)
 
     async def shutdown(self) -> None:
         """Shutdown all providers and cleanup resources."""
         logger.info("Shutting down analytics service")
+
+        if self._worker is not None:
+            # Best-effort drain of pending events before stopping the worker
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("Analytics queue did not drain before shutdown")
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._queue = None
+
         for provider in self.providers:
             try:
                 await provider.shutdown()
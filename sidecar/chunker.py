@@ -16,6 +16,7 @@ import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from bs4 import BeautifulSoup, Tag
 
@@ -53,6 +54,16 @@ _NOISE_CLASSES = re.compile(
 # Maximum characters per chunk before splitting
 _MAX_CHUNK_LEN = 1500
 
+# Tags that produce chunks directly; everything else is skipped before any
+# text extraction so large container tags never pay a full get_text() walk
+_CONTENT_TAGS = frozenset(
+    {"h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "pre", "code", "blockquote", "p"}
+)
+
+# Hot-path regexes, compiled once
+_WS_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 # Regex to find JSON-LD script tags (handles both single and double quotes on type attribute)
 _JSONLD_RE = re.compile(
     r"""<script[^>]*type\s*=\s*['"]application/ld\+json['"][^>]*>(.*?)</script>""",
@@ -80,7 +91,7 @@ def _is_noise_element(tag: Tag) -> bool:
 
 def _clean_text(text: str) -> str:
     """Collapse whitespace and strip leading/trailing space."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 def _split_long_text(text: str, chunk_type: str, max_len: int = _MAX_CHUNK_LEN) -> list[Chunk]:
@@ -89,7 +100,7 @@ def _split_long_text(text: str, chunk_type: str, max_len: int = _MAX_CHUNK_LEN)
         return [Chunk(text=text, chunk_type=chunk_type)]
 
     chunks: list[Chunk] = []
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     current = ""
     for sentence in sentences:
         if current and len(current) + len(sentence) + 1 > max_len:
@@ -105,6 +116,9 @@ def _split_long_text(text: str, chunk_type: str, max_len: int = _MAX_CHUNK_LEN)
 # ISO 8601 Duration Parser
 # ---------------------------------------------------------------------------
 
+# Cached: recipe sites reuse a handful of durations (PT30M, PT1H, …) across
+# thousands of pages, so repeats skip the regex and formatting entirely
+@lru_cache(maxsize=256)
 def parse_iso_duration(duration: str) -> str:
     """Parse an ISO 8601 duration string into a human-readable form.
 
@@ -528,7 +542,7 @@ def _extract_html_meta(soup: BeautifulSoup) -> dict:
 # Unified Metadata Extraction
 # ---------------------------------------------------------------------------
 
-def extract_metadata(html: str, url: str) -> dict:
+def extract_metadata(html: str, url: str, soup: BeautifulSoup | None = None) -> dict:
     """Extract structured metadata from HTML using JSON-LD, OpenGraph, and HTML fallback.
 
     Priority:
@@ -536,11 +550,15 @@ def extract_metadata(html: str, url: str) -> dict:
       2. OpenGraph / Twitter Card tags
       3. HTML meta tags / title / h1 (lowest)
 
+    *soup* lets chunk_html share one parsed tree instead of parsing the
+    document a second time; when None the HTML is parsed here.
+
     Returns a dict with keys:
       title, description, author, published, modified, keywords (list),
       image, type (normalized), schema_type (raw @type), extra (dict)
     """
-    soup = BeautifulSoup(html, "lxml")
+    if soup is None:
+        soup = BeautifulSoup(html, "lxml")
 
     # 1. Try JSON-LD
     ld = _extract_jsonld(html)
@@ -625,10 +643,10 @@ def chunk_html(url: str, html: str, page_updated: str | None = None) -> ParsedPa
     Uses JSON-LD / OpenGraph metadata when available for richer extraction.
     For Recipe pages, adds dedicated ingredient and instruction chunks.
     """
-    # Extract structured metadata first (before soup modifies HTML)
-    rich_meta = extract_metadata(html, url)
-
+    # Parse once and share the tree with metadata extraction; the soup is
+    # only mutated (noise decompose) after all metadata has been pulled out
     soup = BeautifulSoup(html, "lxml")
+    rich_meta = extract_metadata(html, url, soup=soup)
 
     # Extract legacy metadata for language detection
     legacy_meta = _extract_meta(soup)
@@ -666,12 +684,17 @@ def chunk_html(url: str, html: str, page_updated: str | None = None) -> ParsedPa
         if not isinstance(el, Tag):
             continue
 
+        # Filter on the tag name first — containers (div, section, li, …)
+        # are skipped without ever extracting their (potentially huge) text
+        tag = el.name
+        if tag not in _CONTENT_TAGS:
+            continue
+
         text = _clean_text(el.get_text())
         if not text or len(text) < 20 or text in seen_texts:
             continue
 
         # Determine chunk type
-        tag = el.name
         chunk_type = "paragraph"
         if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
             chunk_type = "heading"
@@ -685,16 +708,6 @@ def chunk_html(url: str, html: str, page_updated: str | None = None) -> ParsedPa
                 continue
         elif tag == "blockquote":
             chunk_type = "quote"
-        elif tag == "p":
-            chunk_type = "paragraph"
-        elif tag in ("li",):
-            # Individual list items get folded into parent <ul>/<ol>
-            continue
-        elif tag in ("div", "section", "article", "main"):
-            # Container tags — skip to avoid duplicating child content
-            continue
-        else:
-            continue
 
         seen_texts.add(text)
         chunks.extend(_split_long_text(text, chunk_type))
@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures for the sidecar test suite.
+
+Unit tests need no running server. Integration fixtures target a live
+sidecar at SIDECAR_URL (default http://localhost:8080) and share a single
+keep-alive HTTP client across the whole session.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import httpx
+import pytest
+
+# Ensure sidecar modules are importable regardless of pytest's rootdir
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sync_utils  # noqa: E402  (needs the sys.path entry above)
+from sync_utils import encode_sync_token  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def require_sidecar(client):
+    """Probe /healthz once per session; dependent tests skip if it fails."""
+    try:
+        if client.get("/healthz").status_code != 200:
+            pytest.skip("sidecar not healthy (set SIDECAR_URL if running elsewhere)")
+    except Exception:
+        pytest.skip("sidecar not reachable (set SIDECAR_URL if running elsewhere)")
+
+
+@pytest.fixture(scope="module")
+def encoded_token() -> str:
+    """A sync_token for a fixed timestamp, encoded once per test module."""
+    return encode_sync_token("2026-02-20T00:00:00+00:00")
+
+
+@pytest.fixture
+def tombstone_store(tmp_path):
+    """Empty in-memory tombstone state backed by a per-test temp file."""
+    sync_utils._tombstones = {}
+    sync_utils._rebuild_sorted_index()
+    return tmp_path / "tombstones.json"
+
+
+@pytest.fixture(scope="session")
+def sidecar_url() -> str:
+    return os.environ.get("SIDECAR_URL", "http://localhost:8080")
+
+
+@pytest.fixture(scope="session")
+def client(sidecar_url):
+    """One pooled client for every integration request in the session."""
+    # Split timeouts set once here; individual tests don't pass timeout=.
+    # A dead sidecar fails the connect in 2s instead of a full read timeout.
+    with httpx.Client(
+        base_url=sidecar_url,
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+    ) as c:
+        yield c
@@ -7,12 +7,17 @@ Provides retrieval methods used by the API layer.
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import logging
+import os
+import sqlite3
 import time
 from dataclasses import dataclass
 
 import chromadb
+import numpy as np
+import torch
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
@@ -32,10 +37,38 @@ META_CHUNK_TYPE = "chunk_type"
 META_CHUNK_INDEX = "chunk_index"
 META_INDEXED_AT = "indexed_at"
 META_FIRST_INDEXED_AT = "first_indexed_at"
+META_PUBLISHED_SORTABLE = "published_sortable"
 
 COLLECTION_NAME = "openfeeder_chunks"
 PAGES_COLLECTION = "openfeeder_pages"
 
+# Optional multi-process encode pool for bulk indexing, e.g.
+# OPENFEEDER_ENCODE_DEVICES=cuda:0,cuda:1 or cpu,cpu,cpu
+ENCODE_DEVICES = [
+    d.strip()
+    for d in os.environ.get("OPENFEEDER_ENCODE_DEVICES", "").split(",")
+    if d.strip()
+]
+
+# Minimum batch size before the multi-process pool pays for its IPC overhead
+_MP_ENCODE_MIN_TEXTS = 500
+
+# Max items per Chroma upsert call during bulk indexing
+_UPSERT_BATCH = 1000
+
+# Length buckets for batch encoding as (approx-token cap, batch size):
+# shorter sequences pad less, so they can pack much larger batches
+_ENCODE_BUCKETS = ((32, 256), (64, 128), (128, 64), (256, 32), (512, 16))
+
+# Below this many texts, bucketing overhead outweighs the padding savings
+_BUCKET_ENCODE_MIN_TEXTS = 64
+
+
+def _relevances(distances: list[float]) -> list[float]:
+    """Convert a batch of cosine distances to rounded relevance scores."""
+    scores = np.clip(1.0 - np.asarray(distances, dtype=np.float64), 0.0, 1.0)
+    return np.round(scores, 4).tolist()
+
 
 @dataclass
 class SearchResult:
@@ -51,108 +84,405 @@ class SearchResult:
 class Indexer:
     """Manages the ChromaDB vector store for OpenFeeder content."""
 
-    def __init__(self, persist_dir: str = "/data/chromadb", model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        persist_dir: str = "/data/chromadb",
+        model_name: str = "all-MiniLM-L6-v2",
+        use_fp16: bool = False,
+        compile_model: bool = False,
+        backend: str = "torch",
+    ):
         logger.info("Initialising ChromaDB at %s with model %s", persist_dir, model_name)
         self._client = chromadb.Client(Settings(
             persist_directory=persist_dir,
             is_persistent=True,
             anonymized_telemetry=False,
         ))
-        self._model = SentenceTransformer(model_name)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        if backend not in ("torch", "onnx", "openvino"):
+            raise ValueError(f"Unsupported embedding backend: {backend!r}")
+        if backend != "torch":
+            # ONNX Runtime / OpenVINO inference is 2-4x faster than eager
+            # PyTorch on CPU-only deployments; requires the corresponding
+            # sentence-transformers extra (optimum[onnxruntime] / openvino)
+            try:
+                self._model = SentenceTransformer(model_name, device="cpu", backend=backend)
+                logger.info("Embedding model running on the %s backend", backend)
+            except (ImportError, ModuleNotFoundError) as exc:
+                raise RuntimeError(
+                    f"EMBEDDING_BACKEND={backend} requires the optional "
+                    f"'{backend}' dependencies of sentence-transformers"
+                ) from exc
+        else:
+            self._model = SentenceTransformer(model_name, device=device)
+            if use_fp16 and device == "cuda":
+                # Halves memory bandwidth on GPU; CPU inference stays FP32
+                self._model.half()
+                logger.info("Embedding model running in FP16")
+            if compile_model:
+                self._model = torch.compile(self._model, mode="reduce-overhead")
+                logger.info("Embedding model compiled with torch.compile")
+        # Inner product on unit vectors equals cosine similarity but skips
+        # the per-comparison norm in Chroma's distance loop; all embeddings
+        # are L2-normalized at encode time to keep the two equivalent.
+        # (Only applies to newly created collections — get_or_create leaves
+        # an existing collection's space untouched.)
         self._chunks_col = self._client.get_or_create_collection(
             name=COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine"},
+            metadata={
+                "hnsw:space": "ip",
+                "hnsw:construction_ef": 200,
+                "hnsw:M": 32,
+                # Query-time beam width; the default (10) caps recall below
+                # the largest limit= the API accepts (100)
+                "hnsw:search_ef": 128,
+            },
         )
         self._pages_col = self._client.get_or_create_collection(
             name=PAGES_COLLECTION,
         )
+        # Chroma's .get() returns insertion order, not metadata order, so
+        # the feed index keeps a tiny SQLite table of (url, published) next
+        # to the Chroma store and pushes ORDER BY/LIMIT/OFFSET into it;
+        # page metadata is then fetched from Chroma by id (see get_all_pages)
+        os.makedirs(persist_dir, exist_ok=True)
+        self._order_db = sqlite3.connect(
+            os.path.join(persist_dir, "pages_order.sqlite3"),
+            check_same_thread=False,
+        )
+        self._order_db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, published TEXT NOT NULL)"
+        )
+        self._order_db.execute(
+            "CREATE INDEX IF NOT EXISTS pages_published "
+            "ON pages (published DESC, url)"
+        )
+        self._order_db.commit()
+        self._sync_order_index()
+        # Cache of url -> first_indexed_at so re-indexing a known page
+        # doesn't need a Chroma round-trip just to preserve the timestamp
+        self._first_indexed_cache: dict[str, float] = {}
+        # Lazily started multi-process encode pool (see _encode)
+        self._mp_pool: dict | None = None
 
     # ------------------------------------------------------------------
-    # Indexing
+    # Encoding
     # ------------------------------------------------------------------
 
-    def index_page(self, page: ParsedPage) -> int:
+    def _encode(self, texts: list[str]):
         """
-        Index a parsed page. Replaces any existing chunks for this URL.
-        Returns the number of chunks indexed.
+        Encode texts to a NumPy array of embeddings.
+
+        When OPENFEEDER_ENCODE_DEVICES is set and the batch is large enough
+        to amortize IPC overhead, encoding is distributed across a
+        sentence-transformers multi-process pool (one worker per device).
+        The pool is started lazily on first use and torn down in close().
         """
-        now = time.time()
+        if ENCODE_DEVICES and len(texts) >= _MP_ENCODE_MIN_TEXTS:
+            if self._mp_pool is None:
+                logger.info("Starting encode pool on %s", ", ".join(ENCODE_DEVICES))
+                self._mp_pool = self._model.start_multi_process_pool(
+                    target_devices=ENCODE_DEVICES,
+                )
+            # Sort by length so each worker chunk pads to a homogeneous
+            # sequence length, then restore input order. encode() does this
+            # internally, but encode_multi_process splits into chunks first,
+            # so the sort has to happen here to be effective.
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            vecs = self._model.encode_multi_process(
+                [texts[i] for i in order], self._mp_pool,
+                batch_size=64, chunk_size=1000,
+                normalize_embeddings=True,
+            )
+            inverse = np.empty(len(order), dtype=np.intp)
+            inverse[order] = np.arange(len(order))
+            return vecs[inverse]
+        if len(texts) >= _BUCKET_ENCODE_MIN_TEXTS:
+            return self._bucket_encode(texts)
+        # inference_mode is cheaper than the no_grad used inside encode():
+        # it also skips autograd version-counter bookkeeping
+        with torch.inference_mode():
+            return self._model.encode(texts, show_progress_bar=False, convert_to_numpy=True,
+                                      normalize_embeddings=True)
+
+    def _bucket_encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode a large batch bucketed by approximate token length.
 
-        # Preserve first_indexed_at from existing page metadata
-        existing_meta = self.get_page_meta(page.url)
-        first_indexed_at = (
-            existing_meta.get(META_FIRST_INDEXED_AT, now)
-            if existing_meta
-            else now
-        )
+        A mixed batch pads every sequence to the longest member, so short
+        chunks burn most of their FLOPs on padding. Texts are grouped into
+        _ENCODE_BUCKETS and each bucket is encoded with a batch size tuned
+        to its padded length; results are restored to input order.
+        """
+        buckets: dict[int, list[int]] = {}
+        for i, text in enumerate(texts):
+            # chars/4 is a cheap wordpiece-count estimate; exact counts
+            # would cost a tokenizer pass per text just to pick a bucket
+            approx_tokens = len(text) // 4
+            for cap, _ in _ENCODE_BUCKETS:
+                if approx_tokens <= cap:
+                    break
+            buckets.setdefault(cap, []).append(i)
+
+        batch_sizes = dict(_ENCODE_BUCKETS)
+        index_order: list[int] = []
+        vec_parts: list[np.ndarray] = []
+        with torch.inference_mode():
+            for cap in sorted(buckets):
+                idxs = buckets[cap]
+                vec_parts.append(self._model.encode(
+                    [texts[i] for i in idxs],
+                    batch_size=batch_sizes[cap],
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                ))
+                index_order.extend(idxs)
+
+        inverse = np.empty(len(texts), dtype=np.intp)
+        inverse[np.asarray(index_order, dtype=np.intp)] = np.arange(len(texts))
+        return np.concatenate(vec_parts)[inverse]
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Encode a single query to a unit-normalized float32 vector."""
+        with torch.inference_mode():
+            vec = self._model.encode([query], show_progress_bar=False, convert_to_numpy=True)[0]
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec = vec / norm
+        return vec.astype(np.float32)
+
+    def close(self) -> None:
+        """Release resources held by the indexer (encode pool workers, SQLite)."""
+        if self._mp_pool is not None:
+            self._model.stop_multi_process_pool(self._mp_pool)
+            self._mp_pool = None
+        self._order_db.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
 
-        # Remove old chunks for this URL
-        self._delete_page(page.url)
+    def _prepare_page(self, page: ParsedPage, chunk_vecs, now: float):
+        """
+        Build the upsert payload for one page without touching Chroma.
+
+        Returns (payload, first_indexed_at, previously_indexed) where payload
+        is (ids, documents, float16 chunk vectors, metadatas, page_entry) —
+        or None for a page with no chunks. page_entry is the matching
+        (id, summary, vector, metadata) tuple for the pages collection.
+        """
+        # Preserve first_indexed_at from the cache, falling back to the
+        # existing page metadata on first sight of this URL
+        first_indexed_at = self._first_indexed_cache.get(page.url)
+        previously_indexed = first_indexed_at is not None
+        if not previously_indexed:
+            existing_meta = self.get_page_meta(page.url)
+            previously_indexed = existing_meta is not None
+            first_indexed_at = (
+                existing_meta.get(META_FIRST_INDEXED_AT, now)
+                if existing_meta
+                else now
+            )
 
         if not page.chunks:
-            return 0
+            return None, first_indexed_at, previously_indexed
+
+        # Mean-pool the chunk embeddings for the page-level vector — the
+        # first chunk is usually a title/lede, not a good page representative
+        page_vec = chunk_vecs.mean(axis=0)
+        norm = np.linalg.norm(page_vec)
+        if norm:
+            page_vec = page_vec / norm
+
+        # Persist as float16 — halves vector bytes handed to Chroma with
+        # negligible quality impact for cosine similarity
+        chunk_vecs = chunk_vecs.astype(np.float16)
+        page_vec = page_vec.astype(np.float16)
+
+        # Page-level values are identical for every chunk — compute them once
+        url = page.url
+        title = page.title
+        author = page.author or ""
+        published = page.published or ""
+        updated = page.updated or ""
+        language = page.language
+        summary = page.summary[:500]
 
         ids: list[str] = []
         documents: list[str] = []
-        embeddings: list[list[float]] = []
         metadatas: list[dict] = []
-
-        texts = [c.text for c in page.chunks]
-        vectors = self._model.encode(texts, show_progress_bar=False).tolist()
-
-        for idx, (chunk, vec) in enumerate(zip(page.chunks, vectors)):
-            chunk_id = self._make_id(page.url, idx)
-            ids.append(chunk_id)
+        for idx, chunk in enumerate(page.chunks):
+            ids.append(self._make_id(url, idx))
             documents.append(chunk.text)
-            embeddings.append(vec)
             metadatas.append({
-                META_URL: page.url,
-                META_TITLE: page.title,
-                META_AUTHOR: page.author or "",
-                META_PUBLISHED: page.published or "",
-                META_UPDATED: page.updated or "",
-                META_LANGUAGE: page.language,
-                META_SUMMARY: page.summary[:500],
+                META_URL: url,
+                META_TITLE: title,
+                META_AUTHOR: author,
+                META_PUBLISHED: published,
+                META_UPDATED: updated,
+                META_LANGUAGE: language,
+                META_SUMMARY: summary,
                 META_CHUNK_TYPE: chunk.chunk_type,
                 META_CHUNK_INDEX: idx,
                 META_INDEXED_AT: now,
             })
 
+        page_entry = (
+            self._page_id(url),
+            summary,
+            page_vec,
+            {
+                META_URL: url,
+                META_TITLE: title,
+                META_AUTHOR: author,
+                META_PUBLISHED: published,
+                META_UPDATED: updated,
+                META_LANGUAGE: language,
+                META_SUMMARY: summary,
+                "chunk_count": len(page.chunks),
+                # Sortable key so pagination can run server-side (ISO dates
+                # string-sort chronologically; "0000" sorts unpublished last)
+                META_PUBLISHED_SORTABLE: page.published or "0000",
+                META_FIRST_INDEXED_AT: first_indexed_at,
+                META_INDEXED_AT: now,
+            },
+        )
+        payload = (ids, documents, chunk_vecs, metadatas, page_entry)
+        return payload, first_indexed_at, previously_indexed
+
+    def index_page(self, page: ParsedPage, precomputed_vectors=None) -> int:
+        """
+        Index a parsed page. Replaces any existing chunks for this URL.
+        Returns the number of chunks indexed.
+
+        *precomputed_vectors* lets index_pages share one batched encode call
+        across many pages; when None the chunks are encoded here.
+        """
+        now = time.time()
+
+        if precomputed_vectors is not None:
+            chunk_vecs = precomputed_vectors
+        elif page.chunks:
+            chunk_vecs = self._encode([c.text for c in page.chunks])
+        else:
+            chunk_vecs = None
+
+        payload, first_indexed_at, previously_indexed = self._prepare_page(page, chunk_vecs, now)
+
+        # Remove old chunks for this URL — but only if it was ever indexed;
+        # the where={"url": ...} delete is a full metadata scan in Chroma
+        if previously_indexed:
+            self._delete_page(page.url)
+
+        if payload is None:
+            return 0
+
+        ids, documents, chunk_vecs, metadatas, page_entry = payload
         self._chunks_col.upsert(
             ids=ids,
             documents=documents,
-            embeddings=embeddings,
+            embeddings=chunk_vecs,
             metadatas=metadatas,
         )
 
         # Store page-level metadata
+        page_id, summary, page_vec, page_meta = page_entry
         self._pages_col.upsert(
-            ids=[self._page_id(page.url)],
-            documents=[page.summary[:500]],
-            embeddings=[vectors[0]],  # Use first chunk embedding as page embedding
-            metadatas=[{
-                META_URL: page.url,
-                META_TITLE: page.title,
-                META_AUTHOR: page.author or "",
-                META_PUBLISHED: page.published or "",
-                META_UPDATED: page.updated or "",
-                META_LANGUAGE: page.language,
-                META_SUMMARY: page.summary[:500],
-                "chunk_count": len(page.chunks),
-                META_FIRST_INDEXED_AT: first_indexed_at,
-                META_INDEXED_AT: now,
-            }],
+            ids=[page_id],
+            documents=[summary],
+            embeddings=page_vec[None, :],
+            metadatas=[page_meta],
         )
+        self._record_page_order([(page.url, page_meta[META_PUBLISHED_SORTABLE])])
+
+        self._first_indexed_cache[page.url] = first_indexed_at
 
         logger.info("Indexed %d chunks for %s", len(ids), page.url)
         return len(ids)
 
     def index_pages(self, pages: list[ParsedPage]) -> int:
-        """Index multiple pages. Returns total chunks indexed."""
-        total = 0
+        """
+        Index multiple pages. Returns total chunks indexed.
+
+        All chunk texts across all pages are flattened into a single
+        encode() call, and all upserts are accumulated and sent to Chroma
+        in batches of _UPSERT_BATCH items, so a full crawl pays a handful
+        of segment-writer transactions instead of one per page.
+        """
+        if not pages:
+            return 0
+
+        all_texts = [c.text for page in pages for c in page.chunks]
+        all_vecs = self._encode(all_texts) if all_texts else None
+
+        now = time.time()
+        chunk_ids: list[str] = []
+        chunk_docs: list[str] = []
+        chunk_vec_arrays: list[np.ndarray] = []
+        chunk_metas: list[dict] = []
+        page_ids: list[str] = []
+        page_docs: list[str] = []
+        page_vecs: list[np.ndarray] = []
+        page_metas: list[dict] = []
+        order_rows: list[tuple[str, str]] = []
+        stale_urls: list[str] = []
+        first_indexed: dict[str, float] = {}
+
+        offset = 0
         for page in pages:
-            total += self.index_page(page)
-        return total
+            n_chunks = len(page.chunks)
+            vecs = all_vecs[offset:offset + n_chunks] if n_chunks else None
+            offset += n_chunks
+
+            payload, first_indexed_at, previously_indexed = self._prepare_page(page, vecs, now)
+            if previously_indexed:
+                stale_urls.append(page.url)
+            if payload is None:
+                continue
+
+            ids, documents, vecs16, metadatas, page_entry = payload
+            chunk_ids.extend(ids)
+            chunk_docs.extend(documents)
+            chunk_vec_arrays.append(vecs16)
+            chunk_metas.extend(metadatas)
+            page_id, summary, page_vec, page_meta = page_entry
+            page_ids.append(page_id)
+            page_docs.append(summary)
+            page_vecs.append(page_vec)
+            page_metas.append(page_meta)
+            order_rows.append((page.url, page_meta[META_PUBLISHED_SORTABLE]))
+            first_indexed[page.url] = first_indexed_at
+
+        # One metadata-scan delete for all stale URLs instead of one each
+        if stale_urls:
+            try:
+                self._chunks_col.delete(where={META_URL: {"$in": stale_urls}})
+            except Exception:
+                pass  # Collection may be empty
+
+        if chunk_ids:
+            all_chunk_vecs = np.concatenate(chunk_vec_arrays)
+            for i in range(0, len(chunk_ids), _UPSERT_BATCH):
+                self._chunks_col.upsert(
+                    ids=chunk_ids[i:i + _UPSERT_BATCH],
+                    documents=chunk_docs[i:i + _UPSERT_BATCH],
+                    embeddings=all_chunk_vecs[i:i + _UPSERT_BATCH],
+                    metadatas=chunk_metas[i:i + _UPSERT_BATCH],
+                )
+            for i in range(0, len(page_ids), _UPSERT_BATCH):
+                self._pages_col.upsert(
+                    ids=page_ids[i:i + _UPSERT_BATCH],
+                    documents=page_docs[i:i + _UPSERT_BATCH],
+                    embeddings=np.stack(page_vecs[i:i + _UPSERT_BATCH]),
+                    metadatas=page_metas[i:i + _UPSERT_BATCH],
+                )
+            self._record_page_order(order_rows)
+
+        self._first_indexed_cache.update(first_indexed)
+        logger.info("Indexed %d chunks across %d pages", len(chunk_ids), len(page_ids))
+        return len(chunk_ids)
 
     def delete_page(self, url: str) -> None:
         """
@@ -164,6 +494,9 @@ class Indexer:
             self._pages_col.delete(ids=[self._page_id(url)])
         except Exception:
             pass
+        self._order_db.execute("DELETE FROM pages WHERE url = ?", (url,))
+        self._order_db.commit()
+        self._first_indexed_cache.pop(url, None)
         logger.info("Deleted all data for %s", url)
 
     def _delete_page(self, url: str) -> None:
@@ -173,11 +506,53 @@ class Indexer:
         except Exception:
             pass  # Collection may be empty
 
+    def _record_page_order(self, rows: list[tuple[str, str]]) -> None:
+        """Upsert (url, published) rows into the ordering table."""
+        self._order_db.executemany(
+            "INSERT OR REPLACE INTO pages (url, published) VALUES (?, ?)",
+            rows,
+        )
+        self._order_db.commit()
+
+    def _sync_order_index(self) -> None:
+        """
+        Rebuild the SQLite ordering table from Chroma if the two disagree.
+
+        One-time O(N) migration for stores indexed before the table existed
+        (or after a crash between the two writes); a no-op count check on
+        every normal startup.
+        """
+        sqlite_count = self._order_db.execute(
+            "SELECT COUNT(*) FROM pages").fetchone()[0]
+        if sqlite_count == self._pages_col.count():
+            return
+
+        logger.info("Rebuilding page ordering table from ChromaDB")
+        all_pages = self._pages_col.get(include=["metadatas"])
+        rows = []
+        for meta in all_pages["metadatas"]:
+            published = (meta.get(META_PUBLISHED_SORTABLE)
+                         or meta.get(META_PUBLISHED) or "0000")
+            rows.append((meta.get(META_URL, ""), published))
+        self._order_db.execute("DELETE FROM pages")
+        if rows:
+            self._order_db.executemany(
+                "INSERT OR REPLACE INTO pages (url, published) VALUES (?, ?)",
+                rows,
+            )
+        self._order_db.commit()
+
     # ------------------------------------------------------------------
     # Retrieval
     # ------------------------------------------------------------------
 
-    def search(self, query: str, limit: int = 10, url_filter: str | None = None) -> list[SearchResult]:
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        url_filter: str | None = None,
+        precomputed_vector: np.ndarray | None = None,
+    ) -> list[SearchResult]:
         """
         Semantic search across all indexed chunks.
 
@@ -185,39 +560,70 @@ class Indexer:
             query: Natural language search query.
             limit: Max results to return.
             url_filter: Optional URL to restrict search to one page.
+            precomputed_vector: Embedding of *query* (from embed_query) if the
+                caller already has one, so the query isn't encoded twice.
 
         Returns:
             List of SearchResult ordered by relevance (highest first).
         """
-        query_vec = self._model.encode([query], show_progress_bar=False).tolist()
+        vectors = [precomputed_vector] if precomputed_vector is not None else None
+        return self.search_batch([query], limit=limit, url_filter=url_filter,
+                                 precomputed_vectors=vectors)[0]
+
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        url_filter: str | None = None,
+        precomputed_vectors: list[np.ndarray] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        Semantic search for multiple queries in a single Chroma round-trip.
+
+        All queries are encoded in one SentenceTransformer call and sent as
+        one batched Chroma query, amortizing RPC and HNSW overhead across
+        the batch. Returns one result list per query, in input order.
+        """
+        if precomputed_vectors is not None:
+            query_vecs = np.asarray(precomputed_vectors)
+        else:
+            with torch.inference_mode():
+                query_vecs = self._model.encode(queries, show_progress_bar=False,
+                                                convert_to_numpy=True,
+                                                normalize_embeddings=True)
         where = {META_URL: url_filter} if url_filter else None
 
         results = self._chunks_col.query(
-            query_embeddings=query_vec,
+            query_embeddings=query_vecs.tolist(),
             n_results=min(limit, 50),
             where=where,
             include=["documents", "metadatas", "distances"],
         )
 
-        out: list[SearchResult] = []
-        if not results["ids"] or not results["ids"][0]:
-            return out
-
-        for i, chunk_id in enumerate(results["ids"][0]):
-            distance = results["distances"][0][i]
-            # ChromaDB cosine distance is 1 - similarity
-            relevance = round(max(0.0, 1.0 - distance), 4)
-            meta = results["metadatas"][0][i]
-            out.append(SearchResult(
-                chunk_id=chunk_id,
-                text=results["documents"][0][i],
-                chunk_type=meta.get(META_CHUNK_TYPE, "paragraph"),
-                relevance=relevance,
-                url=meta.get(META_URL, ""),
-                title=meta.get(META_TITLE, ""),
-            ))
-
-        return out
+        batches: list[list[SearchResult]] = []
+        for qi in range(len(queries)):
+            out: list[SearchResult] = []
+            ids = results["ids"][qi] if results["ids"] else []
+            if ids:
+                # ChromaDB cosine distance is 1 - similarity; compute all
+                # relevances in one vectorized pass per query
+                relevances = _relevances(results["distances"][qi])
+                documents = results["documents"][qi]
+                metadatas = results["metadatas"][qi]
+
+                for i, chunk_id in enumerate(ids):
+                    meta = metadatas[i]
+                    out.append(SearchResult(
+                        chunk_id=chunk_id,
+                        text=documents[i],
+                        chunk_type=meta.get(META_CHUNK_TYPE, "paragraph"),
+                        relevance=relevances[i],
+                        url=meta.get(META_URL, ""),
+                        title=meta.get(META_TITLE, ""),
+                    ))
+            batches.append(out)
+
+        return batches
 
     def get_chunks_for_url(self, url: str, limit: int = 50) -> list[dict]:
         """
@@ -233,19 +639,19 @@ class Indexer:
         if not results["ids"]:
             return []
 
-        chunks = []
+        indexed: list[tuple[int, dict]] = []
         for i, chunk_id in enumerate(results["ids"]):
             meta = results["metadatas"][i]
-            chunks.append({
+            indexed.append((meta.get(META_CHUNK_INDEX, 0), {
                 "id": chunk_id,
                 "text": results["documents"][i],
                 "type": meta.get(META_CHUNK_TYPE, "paragraph"),
                 "relevance": None,
-            })
+            }))
 
         # Sort by chunk_index to preserve page order
-        chunks.sort(key=lambda c: c["id"])
-        return chunks
+        indexed.sort(key=lambda pair: pair[0])
+        return [chunk for _, chunk in indexed]
 
     def get_page_meta(self, url: str) -> dict | None:
         """Get metadata for a specific page."""
@@ -262,25 +668,39 @@ class Indexer:
         Get paginated index of all pages.
         Returns (items, total_count).
 
-        NOTE: Memory concern — this method loads ALL page metadata from ChromaDB
-        into memory before applying pagination. For large indexes (>1000 pages),
-        this could consume significant memory. ChromaDB does not natively support
-        offset-based pagination on .get(), so a full load is currently required.
+        Ordering (newest published first, unpublished last) comes from the
+        SQLite ordering table, which pushes ORDER BY/LIMIT/OFFSET down to an
+        index scan; only the requested slice's metadata is then fetched from
+        ChromaDB by id. Memory stays constant regardless of index size.
         """
-        # Get all pages
-        pages_data = self._pages_col.get(include=["metadatas"])
-        if not pages_data["ids"]:
+        total = self._order_db.execute(
+            "SELECT COUNT(*) FROM pages").fetchone()[0]
+        if not total:
             return [], 0
 
-        total = len(pages_data["ids"])
-        if total > 1000:
-            logger.warning(
-                f"Large index detected ({total} pages). get_all_pages() loads all metadata "
-                f"into memory before paginating. Consider implementing ChromaDB native pagination "
-                f"for indexes > 1000 pages."
-            )
+        # ISO dates string-sort chronologically; "0000" (unpublished) sorts
+        # last under DESC. The url tie-break keeps pagination deterministic.
+        slice_urls = [row[0] for row in self._order_db.execute(
+            "SELECT url FROM pages ORDER BY published DESC, url "
+            "LIMIT ? OFFSET ?",
+            (limit, (page - 1) * limit),
+        )]
+        if not slice_urls:
+            return [], total
+
+        pages_data = self._pages_col.get(
+            ids=[self._page_id(url) for url in slice_urls],
+            include=["metadatas"],
+        )
+
+        # Chroma returns fetched ids in its own order; restore the sort order
+        by_url = {meta.get(META_URL, ""): meta
+                  for meta in pages_data["metadatas"]}
         items = []
-        for meta in pages_data["metadatas"]:
+        for url in slice_urls:
+            meta = by_url.get(url)
+            if meta is None:
+                continue
             items.append({
                 "url": meta.get(META_URL, ""),
                 "title": meta.get(META_TITLE, ""),
@@ -288,13 +708,7 @@ class Indexer:
                 "summary": meta.get(META_SUMMARY, ""),
             })
 
-        # Sort by published date (newest first), with unpublished at end
-        items.sort(key=lambda x: x.get("published") or "0000", reverse=True)
-
-        # Paginate
-        start = (page - 1) * limit
-        end = start + limit
-        return items[start:end], total
+        return items, total
 
     def get_pages_since(self, since_ts: float) -> tuple[list[dict], list[dict]]:
         """
@@ -302,31 +716,7 @@ class Indexer:
         (added, updated) lists.  A page is "added" if its first_indexed_at >= since_ts,
         otherwise "updated".
         """
-        all_pages = self._pages_col.get(include=["metadatas"])
-        if not all_pages["ids"]:
-            return [], []
-
-        added: list[dict] = []
-        updated: list[dict] = []
-
-        for meta in all_pages["metadatas"]:
-            indexed_at = meta.get(META_INDEXED_AT, 0)
-            if indexed_at < since_ts:
-                continue
-            page_obj = {
-                "url": meta.get(META_URL, ""),
-                "title": meta.get(META_TITLE, ""),
-                "published": meta.get(META_PUBLISHED, "") or None,
-                "updated": meta.get(META_UPDATED, "") or None,
-                "summary": meta.get(META_SUMMARY, ""),
-            }
-            first = meta.get(META_FIRST_INDEXED_AT, 0)
-            if first >= since_ts:
-                added.append(page_obj)
-            else:
-                updated.append(page_obj)
-
-        return added, updated
+        return self.get_pages_in_range(since_ts, None)
 
     def get_pages_until(self, until_ts: float) -> tuple[list[dict], list[dict]]:
         """
@@ -347,20 +737,30 @@ class Indexer:
 
         A page is "added" if its first_indexed_at >= since_ts (or since_ts
         is None), otherwise "updated".
+
+        The indexed_at range filter is pushed into ChromaDB so only matching
+        pages cross the wire — O(changed pages) instead of O(all pages).
         """
-        all_pages = self._pages_col.get(include=["metadatas"])
-        if not all_pages["ids"]:
+        clauses: list[dict] = []
+        if since_ts is not None:
+            clauses.append({META_INDEXED_AT: {"$gte": since_ts}})
+        if until_ts is not None:
+            clauses.append({META_INDEXED_AT: {"$lte": until_ts}})
+
+        where = None
+        if len(clauses) == 1:
+            where = clauses[0]
+        elif clauses:
+            where = {"$and": clauses}
+
+        matching = self._pages_col.get(where=where, include=["metadatas"])
+        if not matching["ids"]:
             return [], []
 
         added: list[dict] = []
         updated: list[dict] = []
 
-        for meta in all_pages["metadatas"]:
-            indexed_at = meta.get(META_INDEXED_AT, 0)
-            if since_ts is not None and indexed_at < since_ts:
-                continue
-            if until_ts is not None and indexed_at > until_ts:
-                continue
+        for meta in matching["metadatas"]:
             page_obj = {
                 "url": meta.get(META_URL, ""),
                 "title": meta.get(META_TITLE, ""),
@@ -382,9 +782,10 @@ class Indexer:
 
     @staticmethod
     def _make_id(url: str, chunk_index: int) -> str:
-        """Generate a deterministic chunk ID."""
+        """Generate a deterministic, compact chunk ID (11 chars for 64 bits)."""
         raw = f"{url}::chunk::{chunk_index}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+        digest = hashlib.blake2b(raw.encode(), digest_size=8).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
 
     @staticmethod
     def _page_id(url: str) -> str:
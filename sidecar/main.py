@@ -10,6 +10,22 @@ Environment variables:
     MAX_PAGES                  — Maximum pages to crawl (default: 500).
     PORT                       — HTTP listen port (default: 8080).
     EMBEDDING_MODEL            — Sentence-transformer model (default: all-MiniLM-L6-v2).
+    EMBEDDING_FP16             — Set to 1 to run the model in FP16 on GPU.
+    EMBEDDING_COMPILE          — Set to 1 to wrap the model in torch.compile.
+    EMBEDDING_BACKEND          — Inference backend: torch (default), onnx, or
+                                 openvino (faster on CPU-only deployments).
+    UVICORN_WORKERS            — Number of uvicorn worker processes (default: 1).
+    SCHEDULER_ENABLED          — Set to 0 to skip the initial crawl and periodic
+                                 re-crawls in this process. With UVICORN_WORKERS
+                                 > 1 every worker would otherwise crawl; keep it
+                                 enabled in a single dedicated instance instead.
+                                 This is also how to isolate crawl CPU load from
+                                 serving entirely: run one crawler process with
+                                 SCHEDULER_ENABLED=1 and point the serving
+                                 workers (SCHEDULER_ENABLED=0) at the same data
+                                 volume. Chroma's sqlite-backed store allows only
+                                 one writer, so the crawler must be the sole
+                                 writing process.
     OPENFEEDER_WEBHOOK_SECRET  — Optional. If set, POST /openfeeder/update requires
                                  Authorization: Bearer <secret>.
 """
@@ -17,21 +33,28 @@ Environment variables:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import hmac
 import logging
-import math
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Literal
 from urllib.parse import urlparse
 
+import anyio.to_thread
 import httpx
+import numpy as np
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 
 from analytics_provider import (
@@ -44,7 +67,7 @@ from analytics_provider import (
     detect_bot,
 )
 from analytics_service import AnalyticsService
-from chunker import chunk_html
+from chunker import ParsedPage, chunk_html
 from crawler import crawl
 from indexer import Indexer
 from rate_limiter import (
@@ -69,7 +92,11 @@ CRAWL_INTERVAL = int(os.environ.get("CRAWL_INTERVAL", "3600"))
 MAX_PAGES = int(os.environ.get("MAX_PAGES", "500"))
 PORT = int(os.environ.get("PORT", "8080"))
 EMBEDDING_MODEL = os.environ.get("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EMBEDDING_FP16 = os.environ.get("EMBEDDING_FP16", "") == "1"
+EMBEDDING_COMPILE = os.environ.get("EMBEDDING_COMPILE", "") == "1"
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch")
 WEBHOOK_SECRET = os.environ.get("OPENFEEDER_WEBHOOK_SECRET", "")
+SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", "1") == "1"
 
 if not SITE_URL:
     sys.exit("FATAL: SITE_URL environment variable is required.")
@@ -77,6 +104,9 @@ if not SITE_URL:
 SITE_NAME = urlparse(SITE_URL).netloc
 SITE_LANG = os.environ.get("SITE_LANG", "en")
 
+# Precomputed once — relative-URL resolution sits on the hot path
+_SITE_PREFIX = SITE_URL.rstrip("/") + "/"
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -94,43 +124,167 @@ logger = logging.getLogger("openfeeder")
 indexer: Indexer | None = None
 scheduler: AsyncIOScheduler | None = None
 _last_crawl_ts: float = 0.0
-_crawl_running = False
+
+# Guards against overlapping crawls (scheduler tick + manual /crawl POST
+# racing each other); locked() doubles as the "crawl in progress" flag
+_crawl_lock = asyncio.Lock()
+
+# Process pool for CPU-bound HTML parsing (created in lifespan)
+_parse_pool: ProcessPoolExecutor | None = None
+
+# Shared HTTP client for webhook re-fetches (created in lifespan)
+_http_client: httpx.AsyncClient | None = None
 
 # Analytics service (initialized on startup)
 analytics_service: AnalyticsService | None = None
 
+# ---------------------------------------------------------------------------
+# Semantic search cache
+# ---------------------------------------------------------------------------
+#
+# Repeat searches (often the same bot probing the same few terms) would
+# otherwise re-encode the query and re-run HNSW search every time. Rendered
+# search responses are cached keyed by the query embedding, and any query
+# whose embedding is nearly identical to a cached one (cosine >= threshold)
+# is served straight from the cache. The whole cache is dropped whenever the
+# index changes (crawl or webhook update).
+
+SEMANTIC_CACHE_SIZE = 512
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Parallel lists: one unit query vector and one (params, body) per entry,
+# oldest first; _sem_cache_matrix stacks the vectors for one-shot scoring
+_sem_cache_qvecs: list[np.ndarray] = []
+_sem_cache_entries: list[tuple[tuple, dict]] = []
+_sem_cache_matrix: np.ndarray | None = None
+
+
+@lru_cache(maxsize=4096)
+def _embed_query_cached(q: str) -> bytes:
+    """
+    Embed a query string, memoized on the exact (stripped) text.
+
+    Query distributions are heavily skewed toward a small set of popular
+    strings; exact repeats skip the model call entirely, before the
+    similarity-based semantic cache is even consulted. Embeddings don't
+    depend on index contents, so this cache never needs invalidation.
+    Stored as bytes because lru_cache values should be immutable.
+    """
+    return indexer.embed_query(q).tobytes()
+
+
+def _semantic_cache_get(q_vec: np.ndarray, params: tuple) -> dict | None:
+    """Return the cached response body for a near-identical earlier query."""
+    if _sem_cache_matrix is None:
+        return None
+    sims = _sem_cache_matrix @ q_vec
+    for i in np.argsort(sims)[::-1]:
+        if sims[i] < SEMANTIC_CACHE_THRESHOLD:
+            break
+        if _sem_cache_entries[i][0] == params:
+            return _sem_cache_entries[i][1]
+    return None
+
+
+def _semantic_cache_put(q_vec: np.ndarray, params: tuple, body: dict) -> None:
+    """Cache a rendered search response, evicting the oldest entry if full."""
+    global _sem_cache_matrix
+    _sem_cache_qvecs.append(q_vec)
+    _sem_cache_entries.append((params, body))
+    if len(_sem_cache_entries) > SEMANTIC_CACHE_SIZE:
+        del _sem_cache_qvecs[0]
+        del _sem_cache_entries[0]
+    _sem_cache_matrix = np.vstack(_sem_cache_qvecs)
+
+
+def _semantic_cache_clear() -> None:
+    """Drop all cached search responses (the index contents changed)."""
+    global _sem_cache_matrix
+    _sem_cache_qvecs.clear()
+    _sem_cache_entries.clear()
+    _sem_cache_matrix = None
+
+
+# HTML hashes from the previous crawl; pages whose content is byte-identical
+# skip chunking and re-embedding on the next cycle
+_page_hashes: dict[str, bytes] = {}
+
+
+def _chunk_page(args: tuple[str, str, str | None]) -> ParsedPage:
+    """Single-argument chunk_html wrapper for ProcessPoolExecutor.map."""
+    url, html, last_modified = args
+    return chunk_html(url, html, page_updated=last_modified)
+
 
 async def run_crawl() -> None:
     """Execute a full crawl → chunk → index pipeline."""
-    global _last_crawl_ts, _crawl_running
+    global _last_crawl_ts, _page_hashes
 
-    if _crawl_running:
+    if _crawl_lock.locked():
         logger.warning("Crawl already in progress, skipping.")
         return
 
-    _crawl_running = True
-    logger.info("Starting crawl of %s (max %d pages)…", SITE_URL, MAX_PAGES)
-
-    try:
-        result = await crawl(SITE_URL, max_pages=MAX_PAGES)
-        logger.info("Crawled %d pages, %d errors.", len(result.pages), len(result.errors))
+    async with _crawl_lock:
+        logger.info("Starting crawl of %s (max %d pages)…", SITE_URL, MAX_PAGES)
 
-        parsed_pages = []
-        for page in result.pages:
-            parsed = chunk_html(page.url, page.html, page_updated=page.last_modified)
-            parsed_pages.append(parsed)
-
-        total_chunks = indexer.index_pages(parsed_pages)
-        _last_crawl_ts = time.time()
-        logger.info("Indexed %d total chunks across %d pages.", total_chunks, len(parsed_pages))
+        try:
+            result = await crawl(SITE_URL, max_pages=MAX_PAGES)
+            logger.info("Crawled %d pages, %d errors.", len(result.pages), len(result.errors))
+
+            # Only pages whose HTML actually changed since the last crawl go
+            # through chunking + embedding — on steady-state sites this skips
+            # nearly every page on the hourly cycle
+            new_hashes = {
+                page.url: hashlib.blake2b(page.html.encode(), digest_size=16).digest()
+                for page in result.pages
+            }
+            changed = [
+                page for page in result.pages
+                if _page_hashes.get(page.url) != new_hashes[page.url]
+            ]
+
+            # Pages present last cycle but absent now were deleted from the
+            # site. Only trust that signal on a clean crawl — a fetch error
+            # or truncated crawl must not cascade into mass deletion.
+            deleted: set[str] = set()
+            if _page_hashes and result.pages and not result.errors:
+                deleted = set(_page_hashes) - set(new_hashes)
+                for gone_url in deleted:
+                    indexer.delete_page(gone_url)
+                    add_tombstone(gone_url)
+
+            # HTML parsing is CPU-bound; fan it out across the process pool.
+            # map() with a chunksize batches pages per IPC round-trip, which
+            # matters when a crawl yields hundreds of small documents.
+            if _parse_pool is not None:
+                args = [(page.url, page.html, page.last_modified) for page in changed]
+                parsed_pages = await asyncio.to_thread(
+                    lambda: list(_parse_pool.map(_chunk_page, args, chunksize=8))
+                )
+            else:
+                parsed_pages = [
+                    chunk_html(page.url, page.html, page_updated=page.last_modified)
+                    for page in changed
+                ]
+
+            total_chunks = indexer.index_pages(parsed_pages)
+            if parsed_pages or deleted:
+                _semantic_cache_clear()
+            _page_hashes = new_hashes
+            _last_crawl_ts = time.time()
+            logger.info(
+                "Indexed %d chunks across %d changed pages (%d unchanged, %d deleted).",
+                total_chunks,
+                len(parsed_pages),
+                len(result.pages) - len(changed),
+                len(deleted),
+            )
 
-        if result.errors:
-            for err in result.errors[:10]:
-                logger.warning("Crawl error: %s", err)
-    except Exception:
-        logger.exception("Crawl failed")
-    finally:
-        _crawl_running = False
+            if result.errors:
+                for err in result.errors[:10]:
+                    logger.warning("Crawl error: %s", err)
+        except Exception:
+            logger.exception("Crawl failed")
 
 
 # ---------------------------------------------------------------------------
@@ -140,12 +294,41 @@ async def run_crawl() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Start the indexer, run the initial crawl, and schedule periodic re-crawls."""
-    global indexer, scheduler, analytics_service
+    global indexer, scheduler, analytics_service, _parse_pool, _http_client
 
     if not WEBHOOK_SECRET:
         logger.warning("OPENFEEDER_WEBHOOK_SECRET is not set — webhook endpoint is publicly accessible")
 
-    indexer = Indexer(model_name=EMBEDDING_MODEL)
+    # Raise the shared threadpool cap (default 40) — indexer calls are
+    # offloaded to threads and shouldn't queue behind each other under load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
+    # Each worker's torch runtime defaults to nproc intra-op threads; with
+    # several workers on one host that oversubscribes the CPU, so split the
+    # cores between them
+    workers = int(os.environ.get("UVICORN_WORKERS", "1"))
+    if workers > 1:
+        import torch
+
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+
+    indexer = Indexer(
+        model_name=EMBEDDING_MODEL,
+        use_fp16=EMBEDDING_FP16,
+        compile_model=EMBEDDING_COMPILE,
+        backend=EMBEDDING_BACKEND,
+    )
+    _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    _http_client = httpx.AsyncClient(
+        headers={"User-Agent": "OpenFeeder/1.0 (webhook updater)"},
+        follow_redirects=True,
+        timeout=30,
+        limits=httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=30,
+        ),
+    )
     _load_tombstones()
 
     # Initialize rate limiter
@@ -153,19 +336,23 @@ async def lifespan(app: FastAPI):
 
     # Initialize analytics service from environment
     analytics_service = AnalyticsService.from_env()
+    analytics_service.start()
     if analytics_service.enabled:
         logger.info("Analytics service initialized with configured providers")
     else:
         logger.info("Analytics service initialized (no providers enabled)")
 
-    # Initial crawl in background so the server starts responding immediately
-    asyncio.create_task(run_crawl())
+    if SCHEDULER_ENABLED:
+        # Initial crawl in background so the server starts responding immediately
+        asyncio.create_task(run_crawl())
 
-    # Schedule periodic re-crawls
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(run_crawl, "interval", seconds=CRAWL_INTERVAL)
-    scheduler.start()
-    logger.info("Scheduled re-crawl every %d seconds.", CRAWL_INTERVAL)
+        # Schedule periodic re-crawls
+        scheduler = AsyncIOScheduler()
+        scheduler.add_job(run_crawl, "interval", seconds=CRAWL_INTERVAL)
+        scheduler.start()
+        logger.info("Scheduled re-crawl every %d seconds.", CRAWL_INTERVAL)
+    else:
+        logger.info("Scheduler disabled in this process (SCHEDULER_ENABLED=0)")
 
     yield
 
@@ -179,6 +366,15 @@ async def lifespan(app: FastAPI):
     if scheduler:
         scheduler.shutdown(wait=False)
 
+    if indexer:
+        indexer.close()
+
+    if _parse_pool:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+
+    if _http_client:
+        await _http_client.aclose()
+
 
 app = FastAPI(
     title="OpenFeeder Sidecar",
@@ -186,8 +382,14 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Chunk-heavy responses compress 5-10x; clients without Accept-Encoding:
+# gzip still get plain bytes, and StreamingResponse bodies compress on
+# the fly
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ---------------------------------------------------------------------------
 # Middleware — rate limiting and headers
@@ -245,7 +447,7 @@ async def rate_limit_middleware(request: Request, call_next):
                 reset_timestamp=reset_ts,
             ))
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=429,
             content={
                 "error": "RATE_LIMIT_EXCEEDED",
@@ -297,29 +499,34 @@ async def rate_limit_middleware(request: Request, call_next):
 # Discovery endpoint
 # ---------------------------------------------------------------------------
 
+# The discovery document is fully static for a given configuration, so it is
+# serialized once at import time and served as raw bytes.
+_DISCOVERY_BODY = orjson.dumps({
+    "version": "1.0.2",
+    "site": {
+        "name": SITE_NAME,
+        "url": SITE_URL,
+        "language": SITE_LANG,
+        "description": f"OpenFeeder sidecar for {SITE_NAME}",
+    },
+    "feed": {
+        "endpoint": "/openfeeder",
+        "type": "paginated",
+    },
+    "capabilities": ["search", "embeddings", "diff-sync"],
+    "contact": None,
+})
+
+
 @app.get("/.well-known/openfeeder.json")
 async def discovery(request: Request):
     """OpenFeeder discovery document (spec §2)."""
     start_time = time.time()
-    body = {
-        "version": "1.0.2",
-        "site": {
-            "name": SITE_NAME,
-            "url": SITE_URL,
-            "language": SITE_LANG,
-            "description": f"OpenFeeder sidecar for {SITE_NAME}",
-        },
-        "feed": {
-            "endpoint": "/openfeeder",
-            "type": "paginated",
-        },
-        "capabilities": ["search", "embeddings", "diff-sync"],
-        "contact": None,
-    }
-    bot_name, bot_family = detect_bot(request.headers.get("user-agent", ""))
-    duration_ms = int((time.time() - start_time) * 1000)
     if analytics_service and analytics_service.enabled:
-        await analytics_service.track_api_request(APIRequestEvent(
+        bot_name, bot_family = detect_bot(request.headers.get("user-agent", ""))
+        duration_ms = int((time.time() - start_time) * 1000)
+        # Fire analytics in the background so the response isn't held up
+        asyncio.create_task(analytics_service.track_api_request(APIRequestEvent(
             hostname=SITE_NAME,
             endpoint="/.well-known/openfeeder.json",
             method="GET",
@@ -328,14 +535,86 @@ async def discovery(request: Request):
             user_agent=request.headers.get("user-agent", ""),
             bot_name=bot_name,
             bot_family=bot_family,
-        ))
-    return body
+        )))
+    return Response(
+        content=_DISCOVERY_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 
 # ---------------------------------------------------------------------------
 # Content endpoint
 # ---------------------------------------------------------------------------
 
+# Items serialized per fragment when streaming a sync response
+_SYNC_STREAM_BATCH = 100
+
+
+# Sync pollers reuse the same opaque sync_token (and often the same since=
+# value) request after request; cache the parse and the ISO rendering so the
+# hot path skips datetime construction entirely on repeats
+@lru_cache(maxsize=1024)
+def _parse_since_cached(raw: str) -> float | None:
+    return parse_since(raw)
+
+
+@lru_cache(maxsize=2048)
+def _ts_to_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+async def _stream_sync(sync_meta: dict, added: list, updated: list, deleted: list):
+    """
+    Yield a differential-sync response body as pre-encoded JSON fragments.
+
+    Large diffs are serialized in batches of _SYNC_STREAM_BATCH items so peak
+    memory stays bounded regardless of diff size and the event loop regains
+    control between fragments instead of blocking on one big dumps() call.
+    """
+    yield b'{"openfeeder_version":"1.0.2","sync":' + orjson.dumps(sync_meta)
+    for key, items in (("added", added), ("updated", updated), ("deleted", deleted)):
+        yield b',"' + key.encode() + b'":['
+        for i in range(0, len(items), _SYNC_STREAM_BATCH):
+            # orjson returns b'[...]'; strip the brackets to splice batches
+            fragment = orjson.dumps(items[i:i + _SYNC_STREAM_BATCH])[1:-1]
+            yield b"," + fragment if i else fragment
+        yield b"]"
+    yield b"}"
+
+
+async def _stream_index(page_num: int, total_pages: int, items: list):
+    """
+    Yield an index-mode response body as pre-encoded JSON fragments.
+
+    Same framing approach as _stream_sync: items are serialized in batches so
+    the full response body never exists in memory at once and sending overlaps
+    with serialization.
+    """
+    yield (
+        b'{"schema":"openfeeder/1.0","type":"index","page":'
+        + orjson.dumps(page_num)
+        + b',"total_pages":'
+        + orjson.dumps(total_pages)
+        + b',"items":['
+    )
+    for i in range(0, len(items), _SYNC_STREAM_BATCH):
+        fragment = orjson.dumps(items[i:i + _SYNC_STREAM_BATCH])[1:-1]
+        yield b"," + fragment if i else fragment
+    yield b"]}"
+
+
+# orjson serializes dataclasses natively, so search-result chunks go straight
+# from these to JSON without an intermediate dict per chunk; field names are
+# the wire-format keys
+@dataclass(slots=True)
+class _SearchChunk:
+    id: str
+    text: str
+    type: str
+    relevance: float
+
+
 @app.get("/openfeeder")
 async def content(
     request: Request,
@@ -387,8 +666,9 @@ async def content(
                 request_type=request_type,
             ))
 
-    cache_age = int(time.time() - _last_crawl_ts) if _last_crawl_ts else None
-    cached = _last_crawl_ts > 0
+    last_crawl_ts = _last_crawl_ts  # single global lookup for the request
+    cache_age = int(time.time() - last_crawl_ts) if last_crawl_ts else None
+    cached = last_crawl_ts > 0
 
     # ── Differential sync mode (?since= and/or ?until= without ?q=) ─────
     if (since or until) and not q:
@@ -396,7 +676,7 @@ async def content(
         until_ts: float | None = None
 
         if since:
-            since_ts = parse_since(since)
+            since_ts = _parse_since_cached(since)
             if since_ts is None:
                 return _error_response("INVALID_PARAM", "Invalid ?since= value. Provide an RFC3339 datetime or a valid sync_token.", 400)
 
@@ -408,12 +688,12 @@ async def content(
         if since_ts is not None and until_ts is not None and until_ts < since_ts:
             return _error_response("INVALID_PARAM", "?until= must be after ?since=.", 400)
 
-        added, updated = indexer.get_pages_in_range(since_ts, until_ts)
+        added, updated = await asyncio.to_thread(indexer.get_pages_in_range, since_ts, until_ts)
         deleted = get_tombstones_since(since_ts) if since_ts is not None else []
 
         as_of = datetime.now(timezone.utc).isoformat()
-        since_iso = datetime.fromtimestamp(since_ts, tz=timezone.utc).isoformat() if since_ts is not None else None
-        until_iso = datetime.fromtimestamp(until_ts, tz=timezone.utc).isoformat() if until_ts is not None else None
+        since_iso = _ts_to_iso(since_ts) if since_ts is not None else None
+        until_iso = _ts_to_iso(until_ts) if until_ts is not None else None
         token = encode_sync_token(as_of)
 
         sync_meta: dict = {
@@ -430,14 +710,6 @@ async def content(
         if until_iso is not None:
             sync_meta["until"] = until_iso
 
-        body = {
-            "openfeeder_version": "1.0.2",
-            "sync": sync_meta,
-            "added": added,
-            "updated": updated,
-            "deleted": deleted,
-        }
-
         total = len(added) + len(updated) + len(deleted)
         
         # Track sync event
@@ -469,12 +741,16 @@ async def content(
                 request_type="stats",
             ))
         
-        return JSONResponse(content=body, headers={"X-OpenFeeder-Cache": "MISS"})
+        return StreamingResponse(
+            _stream_sync(sync_meta, added, updated, deleted),
+            media_type="application/json",
+            headers={"X-OpenFeeder-Cache": "MISS"},
+        )
 
     # ── Index mode (no url) ──────────────────────────────────────────
     if url is None and q is None:
-        items, total = indexer.get_all_pages(page=page, limit=limit)
-        total_pages = max(1, math.ceil(total / limit))
+        items, total = await asyncio.to_thread(indexer.get_all_pages, page=page, limit=limit)
+        total_pages = max(1, (total + limit - 1) // limit)
         
         # Track index request with detailed metadata
         await track_openfeeder_request(
@@ -486,27 +762,51 @@ async def content(
             status_code=200,
         )
         
-        response = JSONResponse(
-            content={
-                "schema": "openfeeder/1.0",
-                "type": "index",
-                "page": page,
-                "total_pages": total_pages,
-                "items": items,
-            },
+        return StreamingResponse(
+            _stream_index(page, total_pages, items),
+            media_type="application/json",
             headers={"X-OpenFeeder-Cache": "HIT" if cached else "MISS"},
         )
-        return response
 
     # ── Search mode (q param) ───────────────────────────────────────
     if q:
-        results = indexer.search(query=q, limit=limit, url_filter=url)
-        if min_score > 0.0:
-            results = [r for r in results if r.relevance >= min_score]
-        
         # Track whether filters were applied
         has_filters = min_score > 0.0 or url is not None
-        
+
+        # Near-identical query already served? Skip Chroma entirely.
+        q_vec = np.frombuffer(await asyncio.to_thread(_embed_query_cached, q.strip()), dtype=np.float32)
+        cache_params = (limit, url, min_score)
+        cached_body = _semantic_cache_get(q_vec, cache_params)
+        if cached_body is not None:
+            search_duration_ms = int((time.time() - start_time) * 1000)
+            if analytics_service and analytics_service.enabled:
+                await analytics_service.track_search(SearchEvent(
+                    hostname=SITE_NAME,
+                    query=q,
+                    results_count=len(cached_body["chunks"]),
+                    duration_ms=search_duration_ms,
+                    min_score=min_score,
+                    url_filter=url,
+                ))
+            await track_openfeeder_request(
+                request_type="search",
+                results_count=len(cached_body["chunks"]),
+                total_pages=1,
+                query_term=q,
+                has_filters=has_filters,
+                status_code=200,
+            )
+            return ORJSONResponse(
+                content=cached_body,
+                headers={"X-OpenFeeder-Cache": "SEMANTIC"},
+            )
+
+        results = await asyncio.to_thread(
+            indexer.search, query=q, limit=limit, url_filter=url, precomputed_vector=q_vec
+        )
+        if min_score > 0.0:
+            results = [r for r in results if r.relevance >= min_score]
+
         if not results:
             # Track search with 0 results
             search_duration_ms = int((time.time() - start_time) * 1000)
@@ -534,15 +834,10 @@ async def content(
 
         # Group by URL for response — use first result's page metadata
         first = results[0]
-        page_meta = indexer.get_page_meta(first.url) or {}
+        page_meta = await asyncio.to_thread(indexer.get_page_meta, first.url) or {}
 
         chunks = [
-            {
-                "id": r.chunk_id,
-                "text": r.text,
-                "type": r.chunk_type,
-                "relevance": r.relevance,
-            }
+            _SearchChunk(r.chunk_id, r.text, r.chunk_type, r.relevance)
             for r in results
         ]
 
@@ -568,33 +863,36 @@ async def content(
             status_code=200,
         )
 
-        response = JSONResponse(
-            content={
-                "schema": "openfeeder/1.0",
-                "url": first.url,
-                "title": page_meta.get("title", first.title),
-                "author": page_meta.get("author") or None,
-                "published": page_meta.get("published") or None,
-                "updated": page_meta.get("updated") or None,
-                "language": page_meta.get("language", SITE_LANG),
-                "summary": page_meta.get("summary", ""),
-                "chunks": chunks,
-                "meta": {
-                    "total_chunks": len(chunks),
-                    "returned_chunks": len(chunks),
-                    "cached": cached,
-                    "cache_age_seconds": cache_age,
-                },
+        body = {
+            "schema": "openfeeder/1.0",
+            "url": first.url,
+            "title": page_meta.get("title", first.title),
+            "author": page_meta.get("author") or None,
+            "published": page_meta.get("published") or None,
+            "updated": page_meta.get("updated") or None,
+            "language": page_meta.get("language", SITE_LANG),
+            "summary": page_meta.get("summary", ""),
+            "chunks": chunks,
+            "meta": {
+                "total_chunks": len(chunks),
+                "returned_chunks": len(chunks),
+                "cached": cached,
+                "cache_age_seconds": cache_age,
             },
+        }
+        _semantic_cache_put(q_vec, cache_params, body)
+
+        response = ORJSONResponse(
+            content=body,
             headers={"X-OpenFeeder-Cache": "HIT" if cached else "MISS"},
         )
         return response
 
     # ── Single page mode (url param, no q) ──────────────────────────
     # Resolve the url parameter to a full URL for lookup
-    full_url = url if url.startswith("http") else SITE_URL.rstrip("/") + "/" + url.lstrip("/")
+    full_url = url if url.startswith("http") else _SITE_PREFIX + url.lstrip("/")
 
-    page_meta = indexer.get_page_meta(full_url)
+    page_meta = await asyncio.to_thread(indexer.get_page_meta, full_url)
     if not page_meta:
         # Track not found request
         await track_openfeeder_request(
@@ -607,7 +905,7 @@ async def content(
         )
         return _error_response("NOT_FOUND", f"Page not found: {url}", 404)
 
-    chunks = indexer.get_chunks_for_url(full_url, limit=limit)
+    chunks = await asyncio.to_thread(indexer.get_chunks_for_url, full_url, limit=limit)
     
     # Track single page request with detailed metadata
     await track_openfeeder_request(
@@ -619,7 +917,7 @@ async def content(
         status_code=200,
     )
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         content={
             "schema": "openfeeder/1.0",
             "url": full_url,
@@ -670,53 +968,70 @@ def _check_webhook_auth(request: Request) -> None:
         raise HTTPException(status_code=403, detail="Invalid webhook secret")
 
 
+UPDATE_CONCURRENCY = 8
+
+
 async def _process_update(action: str, urls: list[str]) -> tuple[int, list[str]]:
     """
     Core update logic: upsert or delete a list of relative URL paths.
-    Returns (processed_count, error_list).
+    URLs are processed concurrently (at most UPDATE_CONCURRENCY in flight)
+    so downloads overlap with parsing and indexing instead of paying one
+    full round-trip per URL. Returns (processed_count, error_list).
     """
     processed = 0
     errors: list[str] = []
+    sem = asyncio.Semaphore(UPDATE_CONCURRENCY)
 
-    for relative_url in urls:
-        full_url = SITE_URL.rstrip("/") + "/" + relative_url.lstrip("/")
+    async def _one(relative_url: str) -> None:
+        nonlocal processed
+        full_url = _SITE_PREFIX + relative_url.lstrip("/")
         try:
-            if action == "delete":
-                indexer.delete_page(full_url)
-                add_tombstone(full_url)
-                logger.info("Webhook: deleted %s", full_url)
-                processed += 1
-
-            elif action == "upsert":
-                async with httpx.AsyncClient(
-                    headers={"User-Agent": "OpenFeeder/1.0 (webhook updater)"},
-                    follow_redirects=True,
-                    timeout=30,
-                ) as client:
-                    resp = await client.get(full_url)
-
-                if resp.status_code >= 400:
-                    errors.append(f"{full_url}: HTTP {resp.status_code}")
-                    continue
-
-                lm = resp.headers.get("last-modified")
-                last_mod = None
-                if lm:
-                    try:
-                        from email.utils import parsedate_to_datetime
-                        last_mod = parsedate_to_datetime(lm).isoformat()
-                    except Exception:
-                        pass
-
-                parsed = chunk_html(full_url, resp.text, page_updated=last_mod)
-                indexer.index_page(parsed)
-                logger.info("Webhook: upserted %s (%d chunks)", full_url, len(parsed.chunks))
-                processed += 1
+            async with sem:
+                if action == "delete":
+                    indexer.delete_page(full_url)
+                    add_tombstone(full_url)
+                    logger.info("Webhook: deleted %s", full_url)
+                    processed += 1
+
+                elif action == "upsert":
+                    resp = await _http_client.get(full_url)
+
+                    if resp.status_code >= 400:
+                        errors.append(f"{full_url}: HTTP {resp.status_code}")
+                        return
+
+                    lm = resp.headers.get("last-modified")
+                    last_mod = None
+                    if lm:
+                        try:
+                            from email.utils import parsedate_to_datetime
+                            last_mod = parsedate_to_datetime(lm).isoformat()
+                        except Exception:
+                            pass
+
+                    # chunk_html is CPU-bound; run it off the event loop
+                    if _parse_pool is not None:
+                        loop = asyncio.get_running_loop()
+                        parsed = await loop.run_in_executor(
+                            _parse_pool, chunk_html, full_url, resp.text, last_mod
+                        )
+                    else:
+                        parsed = chunk_html(full_url, resp.text, page_updated=last_mod)
+                    indexer.index_page(parsed)
+                    logger.info("Webhook: upserted %s (%d chunks)", full_url, len(parsed.chunks))
+                    processed += 1
 
         except Exception as exc:
             logger.exception("Webhook update failed for %s", full_url)
             errors.append(f"{full_url}: {exc}")
 
+    async with asyncio.TaskGroup() as tg:
+        for relative_url in urls:
+            tg.create_task(_one(relative_url))
+
+    if processed:
+        _semantic_cache_clear()
+
     return processed, errors
 
 
@@ -778,18 +1093,34 @@ def parse_until(value: str) -> float:
         )
 
 
-def _error_response(code: str, message: str, status: int = 400) -> JSONResponse:
+# Error envelopes are pre-encoded per code at import time; only the message
+# is spliced in per response (as an orjson-escaped string, placeholder quotes
+# included), so the hot 404/400 paths skip dict building and serialization
+_ERR_TEMPLATES: dict[str, bytes] = {
+    code: orjson.dumps({
+        "schema": "openfeeder/1.0",
+        "error": {"code": code, "message": "__MSG__"},
+    })
+    for code in ("INVALID_PARAM", "NOT_FOUND")
+}
+
+
+def _error_response(code: str, message: str, status: int = 400) -> Response:
     """Return a spec-compliant error response (spec §8)."""
-    return JSONResponse(
-        status_code=status,
-        content={
-            "schema": "openfeeder/1.0",
-            "error": {
-                "code": code,
-                "message": message,
+    template = _ERR_TEMPLATES.get(code)
+    if template is None:
+        return ORJSONResponse(
+            status_code=status,
+            content={
+                "schema": "openfeeder/1.0",
+                "error": {
+                    "code": code,
+                    "message": message,
+                },
             },
-        },
-    )
+        )
+    body = template.replace(b'"__MSG__"', orjson.dumps(message))
+    return Response(content=body, status_code=status, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -864,7 +1195,7 @@ async def reset_quota(request: Request, ip: str | None = Query(None)):
 @app.post("/crawl")
 async def trigger_crawl(background_tasks: BackgroundTasks):
     """Trigger a manual re-crawl."""
-    if _crawl_running:
+    if _crawl_lock.locked():
         return {"status": "already_running", "message": "A crawl is already in progress"}
     background_tasks.add_task(run_crawl)
     return {"status": "crawl_started", "message": "Re-crawl triggered in background"}
@@ -876,7 +1207,9 @@ async def trigger_crawl(background_tasks: BackgroundTasks):
 
 @app.get("/healthz")
 async def healthz():
-    return {"status": "ok", "crawl_running": _crawl_running, "last_crawl": _last_crawl_ts}
+    return ORJSONResponse(
+        {"status": "ok", "crawl_running": _crawl_lock.locked(), "last_crawl": _last_crawl_ts}
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -885,4 +1218,14 @@ async def healthz():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT, log_level="info")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=PORT,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("UVICORN_WORKERS", "1")),
+        proxy_headers=True,
+        access_log=False,
+    )
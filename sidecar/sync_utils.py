@@ -9,11 +9,26 @@ imported in unit tests without heavy dependencies (ChromaDB, apscheduler, etc.).
 from __future__ import annotations
 
 import base64
+import bisect
 import json
 import logging
 import os
+import struct
+import tempfile
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
+
+try:
+    # Optional C serializer for the tombstone save path; the stdlib
+    # fallback keeps this module importable without any heavy dependencies
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 logger = logging.getLogger("openfeeder.sync")
 
@@ -24,16 +39,26 @@ logger = logging.getLogger("openfeeder.sync")
 
 def encode_sync_token(as_of_iso: str) -> str:
     """Encode a timestamp into an opaque sync_token."""
-    payload = json.dumps({"t": as_of_iso})
-    return base64.b64encode(payload.encode()).decode()
+    # Fixed-layout 8-byte big-endian double → 11-char base64url token,
+    # versus ~40 chars and a JSON roundtrip for the old {"t": iso} payload
+    ts = datetime.fromisoformat(as_of_iso).timestamp()
+    return base64.urlsafe_b64encode(struct.pack(">d", ts)).rstrip(b"=").decode()
 
 
+# Cached: polling clients resend the same token until content changes, so
+# repeat decodes skip the base64/struct work entirely
+@lru_cache(maxsize=256)
 def decode_sync_token(token: str) -> float | None:
     """Decode a sync_token to a Unix timestamp, or return None on failure."""
     try:
-        payload = json.loads(base64.b64decode(token))
-        dt = datetime.fromisoformat(payload["t"])
-        return dt.timestamp()
+        raw = base64.b64decode(
+            token.replace("-", "+").replace("_", "/") + "=" * (-len(token) % 4)
+        )
+        if len(raw) == 8:
+            return struct.unpack(">d", raw)[0]
+        # Legacy JSON token issued by older versions
+        payload = json.loads(raw)
+        return datetime.fromisoformat(payload["t"]).timestamp()
     except Exception:
         return None
 
@@ -57,6 +82,27 @@ def parse_since(raw: str) -> float | None:
 TOMBSTONE_PATH = "/app/data/tombstones.json"
 _tombstones: dict[str, str] = {}  # {url: deleted_at_iso}
 
+# Timestamp-sorted view of _tombstones so get_tombstones_since can bisect
+# instead of scanning every entry: [(deleted_at_ts, url), ...]
+_tombstones_sorted: list[tuple[float, str]] = []
+
+# True only when _tombstones has unsaved changes, so read paths never
+# trigger a disk write
+_tombstones_dirty = False
+
+
+def _rebuild_sorted_index() -> None:
+    """Rebuild the sorted (timestamp, url) index from _tombstones."""
+    global _tombstones_sorted
+    entries: list[tuple[float, str]] = []
+    for url, deleted_at_iso in _tombstones.items():
+        try:
+            entries.append((datetime.fromisoformat(deleted_at_iso).timestamp(), url))
+        except (ValueError, TypeError):
+            pass
+    entries.sort()
+    _tombstones_sorted = entries
+
 
 def _load_tombstones(path: str | None = None) -> None:
     """Load tombstones from disk (best-effort)."""
@@ -67,38 +113,59 @@ def _load_tombstones(path: str | None = None) -> None:
             _tombstones = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         _tombstones = {}
+    _rebuild_sorted_index()
 
 
 def _save_tombstones(path: str | None = None) -> None:
     """Persist tombstones to disk (best-effort, FIFO cap at 1000)."""
-    global _tombstones
+    global _tombstones, _tombstones_dirty
+    if not _tombstones_dirty:
+        return
     p = path or TOMBSTONE_PATH
     # FIFO cap: keep newest 1000
     if len(_tombstones) > 1000:
         sorted_items = sorted(_tombstones.items(), key=lambda x: x[1])
         _tombstones = dict(sorted_items[-1000:])
+        _rebuild_sorted_index()
     os.makedirs(os.path.dirname(p), exist_ok=True)
     try:
-        with open(p, "w") as f:
-            json.dump(_tombstones, f)
+        # Write to a temp file and rename over the target so a crash
+        # mid-write can never leave a truncated tombstones.json behind
+        tmp = tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(p), delete=False)
+        try:
+            tmp.write(_dumps_bytes(_tombstones))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        finally:
+            tmp.close()
+        os.replace(tmp.name, p)
+        _tombstones_dirty = False
     except OSError:
         logger.warning("Could not persist tombstones to %s", p)
 
 
 def add_tombstone(url: str, path: str | None = None) -> None:
     """Record a deletion tombstone."""
-    _tombstones[url] = datetime.now(timezone.utc).isoformat()
+    global _tombstones_dirty
+    now = datetime.now(timezone.utc)
+    if url in _tombstones:
+        # Re-deletion — drop the stale sorted entry before inserting anew
+        try:
+            old_ts = datetime.fromisoformat(_tombstones[url]).timestamp()
+            _tombstones_sorted.remove((old_ts, url))
+        except (ValueError, TypeError):
+            pass
+    _tombstones[url] = now.isoformat()
+    bisect.insort(_tombstones_sorted, (now.timestamp(), url))
+    _tombstones_dirty = True
     _save_tombstones(path)
 
 
 def get_tombstones_since(since_ts: float) -> list[dict]:
     """Return tombstones where deleted_at >= since_ts."""
-    result = []
-    for url, deleted_at_iso in _tombstones.items():
-        try:
-            dt = datetime.fromisoformat(deleted_at_iso)
-            if dt.timestamp() >= since_ts:
-                result.append({"url": url, "deleted_at": deleted_at_iso})
-        except (ValueError, TypeError):
-            pass
-    return result
+    start = bisect.bisect_left(_tombstones_sorted, (since_ts,))
+    return [
+        {"url": url, "deleted_at": _tombstones[url]}
+        for _, url in _tombstones_sorted[start:]
+        if url in _tombstones
+    ]
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 OpenFeeder Sidecar — Unit + Integration Tests
 
@@ -6,452 +5,309 @@ Unit tests exercise local functions (no sidecar needed).
 Integration tests hit a running sidecar (skipped if not reachable).
 
 Usage:
-    python3 sidecar/test_sidecar.py
-    SIDECAR_URL=http://localhost:8080 python3 sidecar/test_sidecar.py
+    python -m pytest sidecar/test_sidecar.py
+    SIDECAR_URL=http://localhost:8080 python -m pytest sidecar/test_sidecar.py
 """
 
 from __future__ import annotations
 
-import os
-import sys
+import asyncio
+import base64
+import struct
+import time
+from datetime import datetime
 
-# Ensure sidecar modules are importable
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# ── Test runner ──────────────────────────────────────────────────────────────
-
-passed = 0
-failed = 0
-skipped = 0
-
-
-def check(condition: bool, label: str) -> None:
-    global passed, failed
-    if condition:
-        print(f"  PASS  {label}")
-        passed += 1
-    else:
-        print(f"  FAIL  {label}")
-        failed += 1
-
-
-def skip(label: str) -> None:
-    global skipped
-    print(f"  SKIP  {label}")
-    skipped += 1
+import httpx
+import orjson
+import pytest
 
+import sync_utils
+from analytics import detect_bot
+from chunker import parse_iso_duration
+from sync_utils import decode_sync_token, parse_since
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Unit Tests (no sidecar needed)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def test_detect_bot() -> None:
-    """Test detect_bot() from analytics.py."""
-    print("\nUnit: detect_bot()")
-
-    from analytics import detect_bot
-
-    name, family = detect_bot("GPTBot/1.0")
-    check(name == "GPTBot", 'GPTBot/1.0 → name="GPTBot"')
-    check(family == "openai", 'GPTBot/1.0 → family="openai"')
-
-    name, family = detect_bot("ClaudeBot")
-    check(name == "ClaudeBot", 'ClaudeBot → name="ClaudeBot"')
-    check(family == "anthropic", 'ClaudeBot → family="anthropic"')
-
-    name, family = detect_bot("Mozilla/5.0 (human)")
-    check(name == "human-or-unknown", 'human UA → name="human-or-unknown"')
-    check(family == "unknown", 'human UA → family="unknown"')
-
-    name, family = detect_bot("")
-    check(name == "unknown", 'empty → name="unknown"')
-    check(family == "unknown", 'empty → family="unknown"')
-
-    name, family = detect_bot("PerplexityBot/1.0")
-    check(name == "PerplexityBot", 'PerplexityBot/1.0 → name="PerplexityBot"')
-    check(family == "perplexity", 'PerplexityBot/1.0 → family="perplexity"')
-
-
-def test_parse_iso_duration() -> None:
-    """Test parse_iso_duration() from chunker.py."""
-    print("\nUnit: parse_iso_duration()")
-
-    from chunker import parse_iso_duration
-
-    check(parse_iso_duration("PT25M") == "25 min", 'PT25M → "25 min"')
-    check(parse_iso_duration("PT1H30M") == "1h 30 min", 'PT1H30M → "1h 30 min"')
-    check(parse_iso_duration("P1DT2H") == "1d 2h", 'P1DT2H → "1d 2h"')
 
-    # Edge case: PT0S — no parts match the "if days/hours/minutes/seconds" guards,
-    # so it returns the raw duration string.
-    result = parse_iso_duration("PT0S")
-    check(result == "" or result == "0s" or result == "PT0S", f'PT0S → "{result}" (edge case)')
-
-    # None / empty → no crash
-    check(parse_iso_duration(None) == "", "None → empty string")
-    check(parse_iso_duration("") == "", 'empty → empty string')
-
-
-def test_sync_token() -> None:
-    """Test sync_token encode/decode round-trip."""
-    print("\nUnit: sync_token encode/decode")
-
-    from sync_utils import encode_sync_token, decode_sync_token, parse_since
-
-    # Encode a known timestamp
+@pytest.mark.parametrize(
+    "ua,name,family",
+    [
+        ("GPTBot/1.0", "GPTBot", "openai"),
+        ("ClaudeBot", "ClaudeBot", "anthropic"),
+        ("Mozilla/5.0 (human)", "human-or-unknown", "unknown"),
+        ("", "unknown", "unknown"),
+        ("PerplexityBot/1.0", "PerplexityBot", "perplexity"),
+    ],
+)
+def test_detect_bot(ua, name, family):
+    assert detect_bot(ua) == (name, family)
+
+
+@pytest.mark.parametrize(
+    "duration,expected",
+    [
+        ("PT25M", "25 min"),
+        ("PT1H30M", "1h 30 min"),
+        ("P1DT2H", "1d 2h"),
+        (None, ""),
+        ("", ""),
+    ],
+)
+def test_parse_iso_duration(duration, expected):
+    assert parse_iso_duration(duration) == expected
+
+
+def test_parse_iso_duration_zero_seconds():
+    # Edge case: PT0S — no parts match the "if days/hours/minutes/seconds"
+    # guards, so it returns the raw duration string.
+    assert parse_iso_duration("PT0S") in ("", "0s", "PT0S")
+
+
+def test_sync_token_roundtrip(encoded_token):
     iso = "2026-02-20T00:00:00+00:00"
-    token = encode_sync_token(iso)
-    check(isinstance(token, str) and len(token) > 0, "encode returns non-empty string")
+    token = encoded_token
+    assert isinstance(token, str) and len(token) > 0
 
-    # Decode it back
     ts = decode_sync_token(token)
-    check(ts is not None, "decode returns a timestamp")
-
-    import base64, json
-    payload = json.loads(base64.b64decode(token))
-    check(payload.get("t") == iso, 'token payload has correct "t" field')
+    assert ts is not None
 
-    # parse_since with RFC 3339
-    ts_rfc = parse_since("2026-02-20T00:00:00Z")
-    check(ts_rfc is not None and ts_rfc > 0, "parse_since handles RFC 3339")
+    # Token wire format: big-endian double, base64url without padding
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    assert struct.unpack(">d", raw)[0] == datetime.fromisoformat(iso).timestamp()
 
-    # parse_since with sync_token
-    ts_token = parse_since(token)
-    check(ts_token is not None and ts_token > 0, "parse_since handles sync_token")
 
-    # parse_since with garbage
-    ts_bad = parse_since("not-a-date-or-token")
-    check(ts_bad is None, "parse_since returns None for garbage input")
+@pytest.mark.parametrize(
+    "raw,ok",
+    [
+        ("2026-02-20T00:00:00Z", True),  # RFC 3339
+        ("not-a-date-or-token", False),  # garbage
+        ("2026-02-15T00:00:00Z", True),  # reused for ?until= (RFC 3339 only)
+    ],
+)
+def test_parse_since(raw, ok):
+    ts = parse_since(raw)
+    assert (ts is not None and ts > 0) if ok else ts is None
 
-    # parse_since is reused for ?until= (RFC 3339 only — no sync_token)
-    ts_until = parse_since("2026-02-15T00:00:00Z")
-    check(ts_until is not None and ts_until > 0, "parse_since handles ?until= RFC3339")
 
+def test_parse_since_accepts_sync_token(encoded_token):
+    ts = parse_since(encoded_token)
+    assert ts is not None and ts > 0
 
-def test_tombstone_helpers() -> None:
-    """Test tombstone helper functions."""
-    print("\nUnit: tombstone helpers")
 
-    import sync_utils
-    import tempfile, os
-
-    # Override tombstone path for testing
-    tmp = tempfile.mkdtemp()
-    test_path = os.path.join(tmp, "tombstones.json")
-    sync_utils.TOMBSTONE_PATH = test_path
-    sync_utils._tombstones = {}
+def test_tombstone_helpers(tombstone_store):
+    test_path = str(tombstone_store)
 
-    # Add a tombstone
     sync_utils.add_tombstone("https://example.com/deleted-page", test_path)
-    check(len(sync_utils._tombstones) == 1, "tombstone added")
+    assert len(sync_utils._tombstones) == 1
 
-    # Get tombstones since a past date
     results = sync_utils.get_tombstones_since(0.0)
-    check(len(results) == 1, "get_tombstones_since returns 1 result")
-    check(results[0]["url"] == "https://example.com/deleted-page", "tombstone URL matches")
+    assert len(results) == 1
+    assert results[0]["url"] == "https://example.com/deleted-page"
 
-    # Get tombstones since a future date → empty
-    import time
-    results_future = sync_utils.get_tombstones_since(time.time() + 86400)
-    check(len(results_future) == 0, "get_tombstones_since returns 0 for future date")
+    assert sync_utils.get_tombstones_since(time.time() + 86400) == []
 
-    # Verify file was written
-    check(os.path.exists(test_path), "tombstones file created")
-
-    # Load from disk
+    # Persisted and reloadable
+    assert tombstone_store.exists()
     sync_utils._tombstones = {}
     sync_utils._load_tombstones(test_path)
-    check(len(sync_utils._tombstones) == 1, "tombstones loaded from disk")
+    assert len(sync_utils._tombstones) == 1
+
+
+def test_indexer_get_pages_in_range(tmp_path, monkeypatch):
+    """Indexer.get_pages_in_range() for ?until= and ?since=&until= modes."""
+    indexer_mod = pytest.importorskip("indexer")
+    from chunker import Chunk, ParsedPage
+
+    monkeypatch.setenv("CHROMA_PATH", str(tmp_path / "chroma"))
+    idx = indexer_mod.Indexer(model_name="all-MiniLM-L6-v2")
+
+    early_ts = time.time() - 7200  # 2 hours ago
+    idx.index_page(ParsedPage(
+        url="https://example.com/old",
+        title="Old Article",
+        author=None,
+        published="2026-01-01T00:00:00Z",
+        updated=None,
+        language="en",
+        summary="An old article.",
+        chunks=[Chunk(text="Content of old article.", chunk_type="text", index=0)],
+    ))
+    idx.index_page(ParsedPage(
+        url="https://example.com/new",
+        title="New Article",
+        author=None,
+        published="2026-02-20T00:00:00Z",
+        updated=None,
+        language="en",
+        summary="A new article.",
+        chunks=[Chunk(text="Content of new article.", chunk_type="text", index=0)],
+    ))
+
+    # ?until= alone: all pages indexed up to now → should include both
+    added, updated = idx.get_pages_in_range(None, time.time() + 60)
+    assert len(added) + len(updated) == 2
+
+    # ?until= in the distant past → empty
+    added, updated = idx.get_pages_in_range(None, early_ts - 3600)
+    assert len(added) + len(updated) == 0
+
+    # ?since= far in the future → empty
+    added, updated = idx.get_pages_in_range(time.time() + 86400, None)
+    assert len(added) + len(updated) == 0
+
+    # ?since=0 → all pages
+    added, updated = idx.get_pages_in_range(0.0, None)
+    assert len(added) + len(updated) == 2
+
+    # ?since=0&until=now+60 → all pages
+    added, updated = idx.get_pages_in_range(0.0, time.time() + 60)
+    assert len(added) + len(updated) == 2
 
-    # Cleanup
-    os.remove(test_path)
-    os.rmdir(tmp)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Integration Tests (skip if sidecar not reachable)
+# ═══════════════════════════════════════════════════════════════════════════
 
-def test_indexer_get_pages_in_range() -> None:
-    """Test Indexer.get_pages_in_range() for ?until= and ?since=&until= modes."""
-    print("\nUnit: Indexer.get_pages_in_range()")
 
-    import time
-    import tempfile
-    import os
+@pytest.fixture
+def live(require_sidecar, client):
+    """The shared client; skips via require_sidecar when no sidecar runs."""
+    return client
 
-    try:
-        from indexer import Indexer
-        from chunker import ParsedPage, Chunk
-    except ImportError as exc:
-        skip(f"indexer/chunker import failed ({exc}) — skipping")
-        return
 
-    tmp = tempfile.mkdtemp()
-    old = os.environ.get("CHROMA_PATH")
-    os.environ["CHROMA_PATH"] = os.path.join(tmp, "chroma")
-
-    try:
-        idx = Indexer(model_name="all-MiniLM-L6-v2")
-
-        # Index a page in the "past"
-        early_ts = time.time() - 7200  # 2 hours ago
-        old_page = ParsedPage(
-            url="https://example.com/old",
-            title="Old Article",
-            author=None,
-            published="2026-01-01T00:00:00Z",
-            updated=None,
-            language="en",
-            summary="An old article.",
-            chunks=[Chunk(text="Content of old article.", chunk_type="text", index=0)],
-        )
-        idx.index_page(old_page)
-
-        # Index a page in the "recent" past
-        idx.index_page(ParsedPage(
-            url="https://example.com/new",
-            title="New Article",
-            author=None,
-            published="2026-02-20T00:00:00Z",
-            updated=None,
-            language="en",
-            summary="A new article.",
-            chunks=[Chunk(text="Content of new article.", chunk_type="text", index=0)],
-        ))
-
-        # ?until= alone: all pages indexed up to now → should include both
-        added, updated = idx.get_pages_in_range(None, time.time() + 60)
-        check(len(added) + len(updated) == 2, "?until=future includes all pages")
-
-        # ?until= in the distant past → empty
-        added, updated = idx.get_pages_in_range(None, early_ts - 3600)
-        check(len(added) + len(updated) == 0, "?until=before_index returns empty")
-
-        # ?since= far in the future → empty
-        added, updated = idx.get_pages_in_range(time.time() + 86400, None)
-        check(len(added) + len(updated) == 0, "?since=future returns empty")
-
-        # ?since=0 → all pages
-        added_all, updated_all = idx.get_pages_in_range(0.0, None)
-        check(len(added_all) + len(updated_all) == 2, "?since=0 returns all pages")
-
-        # ?since=0&until=now+60 → all pages
-        added2, updated2 = idx.get_pages_in_range(0.0, time.time() + 60)
-        check(len(added2) + len(updated2) == 2, "?since=0&until=future includes all pages")
-
-    except Exception as exc:
-        check(False, f"Indexer.get_pages_in_range raised {exc!r}")
-    finally:
-        if old is None:
-            os.environ.pop("CHROMA_PATH", None)
-        else:
-            os.environ["CHROMA_PATH"] = old
-        import shutil
-        shutil.rmtree(tmp, ignore_errors=True)
+def _json(r: httpx.Response):
+    """Decode a response body with orjson (C parser) instead of stdlib json."""
+    return orjson.loads(r.content)
 
 
-# ═══════════════════════════════════════════════════════════════════════════
-# Integration Tests (skip if sidecar not reachable)
-# ═══════════════════════════════════════════════════════════════════════════
+def test_healthz(live):
+    assert live.get("/healthz").status_code == 200
 
-def sidecar_reachable(base_url: str) -> bool:
-    """Check if the sidecar is reachable."""
-    try:
-        import httpx
-        r = httpx.get(f"{base_url}/healthz", timeout=3)
-        return r.status_code == 200
-    except Exception:
-        return False
-
-
-def test_integration(base_url: str) -> None:
-    """Run integration tests against a live sidecar."""
-    import httpx
-
-    print(f"\nIntegration tests against {base_url}")
-
-    # GET /healthz
-    print("\nIntegration: GET /healthz")
-    r = httpx.get(f"{base_url}/healthz", timeout=10)
-    check(r.status_code == 200, "healthz returns 200")
-
-    # GET /.well-known/openfeeder.json
-    print("\nIntegration: GET /.well-known/openfeeder.json")
-    r = httpx.get(f"{base_url}/.well-known/openfeeder.json", timeout=10)
-    check(r.status_code == 200, "discovery returns 200")
-    data = r.json()
-    check("feed" in data and "endpoint" in data["feed"], "has feed.endpoint")
-
-    # GET /openfeeder (index)
-    print("\nIntegration: GET /openfeeder")
-    r = httpx.get(f"{base_url}/openfeeder", timeout=10)
-    check(r.status_code == 200, "index returns 200")
-    data = r.json()
-    check("schema" in data, "has schema field")
-    check("items" in data, "has items field")
-
-    # GET /openfeeder?q=test (search)
-    print("\nIntegration: GET /openfeeder?q=test")
-    r = httpx.get(f"{base_url}/openfeeder", params={"q": "test"}, timeout=10)
-    if r.status_code == 200:
-        data = r.json()
-        check("chunks" in data or "items" in data, "search has chunks or items")
-    elif r.status_code == 404:
-        # No results — valid response
-        check(True, "search returns 404 (no results — valid)")
-    else:
-        check(False, f"search returned unexpected status {r.status_code}")
-
-    # GET /openfeeder?q=test&min_score=0.99 → empty or 404
-    print("\nIntegration: GET /openfeeder?q=test&min_score=0.99")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
-        params={"q": "test", "min_score": "0.99"},
-        timeout=10,
-    )
-    if r.status_code == 404:
-        check(True, "min_score=0.99 returns 404 (nothing that high)")
-    elif r.status_code == 200:
-        data = r.json()
-        chunks = data.get("chunks", [])
-        check(len(chunks) == 0, "min_score=0.99 returns empty chunks")
-    else:
-        check(r.status_code in (200, 404), f"unexpected status {r.status_code}")
-
-    # GET /openfeeder?q=test&min_score=0.0 → has chunks
-    print("\nIntegration: GET /openfeeder?q=test&min_score=0.0")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
-        params={"q": "test", "min_score": "0.0"},
-        timeout=10,
-    )
-    if r.status_code == 200:
-        data = r.json()
-        check("chunks" in data or "items" in data, "min_score=0.0 has results")
-    elif r.status_code == 404:
-        check(True, "min_score=0.0 returns 404 (no indexed content yet — valid)")
+
+def test_discovery(live):
+    r = live.get("/.well-known/openfeeder.json")
+    assert r.status_code == 200
+    data = _json(r)
+    assert "feed" in data and "endpoint" in data["feed"]
+
+
+# The GET /openfeeder variants are structurally identical — params plus a
+# set of accepted statuses — so they share one body and one warm keep-alive
+# connection. 404 on search means "no results", which is valid.
+@pytest.mark.parametrize(
+    "params,accepted",
+    [
+        ({}, {200}),
+        ({"q": "test"}, {200, 404}),
+        ({"q": "test", "min_score": "0.99"}, {200, 404}),
+        ({"q": "test", "min_score": "0.0"}, {200, 404}),
+        ({"since": "2020-01-01T00:00:00Z"}, {200}),
+    ],
+)
+def test_feed_variants(live, params, accepted):
+    r = live.get("/openfeeder", params=params)
+    assert r.status_code in accepted
+    if r.status_code != 200:
+        return
+    data = _json(r)
+    if "since" in params:
+        assert "sync" in data
+    elif params.get("min_score") == "0.99":
+        assert data.get("chunks", []) == []  # nothing scores that high
+    elif "q" in params:
+        assert "chunks" in data or "items" in data
     else:
-        check(False, f"unexpected status {r.status_code}")
+        assert "schema" in data
+        assert "items" in data
+
 
-    # POST /openfeeder/update
-    print("\nIntegration: POST /openfeeder/update")
-    r = httpx.post(
-        f"{base_url}/openfeeder/update",
+def test_update_webhook(live):
+    r = live.post(
+        "/openfeeder/update",
         json={"action": "upsert", "urls": ["/nonexistent-test-path"]},
-        timeout=30,
+        timeout=30,  # upsert fetches the page before answering
     )
-    check(r.status_code == 200 or r.status_code == 401, "update returns 200 or 401 (auth)")
+    assert r.status_code in (200, 401)  # 401 = auth required
     if r.status_code == 200:
-        data = r.json()
-        check("status" in data, "update response has status field")
-
-    # GET /openfeeder?since= (differential sync)
-    print("\nIntegration: GET /openfeeder?since=2020-01-01T00:00:00Z")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
-        params={"since": "2020-01-01T00:00:00Z"},
-        timeout=10,
-    )
-    check(r.status_code == 200, "diff sync returns 200")
-    data = r.json()
-    check("sync" in data, "has sync envelope")
-    check("sync_token" in data.get("sync", {}), "has sync_token")
-    check("added" in data, "has added array")
-    check("updated" in data, "has updated array")
-    check("deleted" in data, "has deleted array")
-
-    # GET /openfeeder?until= (upper-bound only)
-    print("\nIntegration: GET /openfeeder?until=2099-01-01T00:00:00Z")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
-        params={"until": "2099-01-01T00:00:00Z"},
-        timeout=10,
-    )
-    check(r.status_code == 200, "?until= alone returns 200")
-    data_u = r.json()
-    check("sync" in data_u, "?until= response has sync envelope")
-    check("until" in data_u.get("sync", {}), "?until= included in sync meta")
-    check("since" not in data_u.get("sync", {}), "no 'since' when only ?until= is given")
-    check("added" in data_u, "?until= response has added array")
-
-    # GET /openfeeder?since=&until= (closed range)
-    print("\nIntegration: GET /openfeeder?since=2020-01-01T00:00:00Z&until=2099-01-01T00:00:00Z")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
+        assert "status" in _json(r)
+
+
+def test_diff_sync_and_token_roundtrip(live):
+    r = live.get("/openfeeder", params={"since": "2020-01-01T00:00:00Z"})
+    assert r.status_code == 200
+    data = _json(r)
+    assert "sync" in data
+    assert "sync_token" in data["sync"]
+    assert "added" in data
+    assert "updated" in data
+    assert "deleted" in data
+
+    # The returned token must itself be a valid ?since= value
+    token = data["sync"]["sync_token"]
+    r2 = live.get("/openfeeder", params={"since": token})
+    assert r2.status_code == 200
+    assert "sync" in _json(r2)
+
+
+def test_diff_sync_until_only(live):
+    r = live.get("/openfeeder", params={"until": "2099-01-01T00:00:00Z"})
+    assert r.status_code == 200
+    data = _json(r)
+    assert "sync" in data
+    assert "until" in data["sync"]
+    assert "since" not in data["sync"]
+    assert "added" in data
+
+
+def test_diff_sync_closed_range(live):
+    r = live.get(
+        "/openfeeder",
         params={"since": "2020-01-01T00:00:00Z", "until": "2099-01-01T00:00:00Z"},
-        timeout=10,
     )
-    check(r.status_code == 200, "?since=&until= returns 200")
-    data_range = r.json()
-    check("sync" in data_range, "range response has sync envelope")
-    check("since" in data_range.get("sync", {}), "range response has 'since' in sync")
-    check("until" in data_range.get("sync", {}), "range response has 'until' in sync")
-
-    # GET /openfeeder?since=&until= where until < since → 400
-    print("\nIntegration: GET /openfeeder?since=2030-01-01&until=2020-01-01 → 400")
-    r = httpx.get(
-        f"{base_url}/openfeeder",
+    assert r.status_code == 200
+    data = _json(r)
+    assert "sync" in data
+    assert "since" in data["sync"]
+    assert "until" in data["sync"]
+
+
+def test_diff_sync_inverted_range(live):
+    r = live.get(
+        "/openfeeder",
         params={"since": "2030-01-01T00:00:00Z", "until": "2020-01-01T00:00:00Z"},
-        timeout=10,
     )
-    check(r.status_code == 400, "until < since returns 400")
-
-    # Sync token round-trip
-    print("\nIntegration: sync_token round-trip")
-    token = data.get("sync", {}).get("sync_token", "")
-    if token:
-        r2 = httpx.get(
-            f"{base_url}/openfeeder",
-            params={"since": token},
-            timeout=10,
+    assert r.status_code == 400
+
+
+def test_crawl_trigger(live):
+    r = live.post("/crawl")
+    assert r.status_code == 200
+    assert _json(r).get("status") in ("crawl_started", "already_running")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_endpoints(require_sidecar, sidecar_url):
+    """Independent endpoints answer correctly when requested concurrently.
+
+    Also the fast path for a broad smoke check: wall time is the slowest
+    response, not the sum, since the requests multiplex one keep-alive pool.
+    """
+    async with httpx.AsyncClient(
+        base_url=sidecar_url,
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(max_keepalive_connections=10),
+    ) as ac:
+        healthz, discovery, index, search, until = await asyncio.gather(
+            ac.get("/healthz"),
+            ac.get("/.well-known/openfeeder.json"),
+            ac.get("/openfeeder"),
+            ac.get("/openfeeder", params={"q": "test"}),
+            ac.get("/openfeeder", params={"until": "2099-01-01T00:00:00Z"}),
         )
-        check(r2.status_code == 200, "token-based request returns 200")
-        data2 = r2.json()
-        check("sync" in data2, "token-based response has sync envelope")
-    else:
-        skip("no sync_token to test round-trip")
-
-    # POST /crawl
-    print("\nIntegration: POST /crawl")
-    r = httpx.post(f"{base_url}/crawl", timeout=10)
-    check(r.status_code == 200, "crawl returns 200")
-    if r.status_code == 200:
-        data = r.json()
-        check(
-            data.get("status") in ("crawl_started", "already_running"),
-            f'crawl status is "{data.get("status")}"',
-        )
-
-
-# ═══════════════════════════════════════════════════════════════════════════
-# Main
-# ═══════════════════════════════════════════════════════════════════════════
-
-def main() -> None:
-    print(f"OpenFeeder Sidecar Tests\n{'=' * 55}")
-
-    # Unit tests — always run
-    test_detect_bot()
-    test_parse_iso_duration()
-    test_sync_token()
-    test_tombstone_helpers()
-    test_indexer_get_pages_in_range()
-
-    # Integration tests — skip if sidecar not reachable
-    base_url = os.environ.get("SIDECAR_URL", "http://localhost:8080")
-    if sidecar_reachable(base_url):
-        test_integration(base_url)
-    else:
-        print(f"\n  SKIP  Integration tests (sidecar not reachable at {base_url})")
-        print("         Set SIDECAR_URL env var if running elsewhere.")
-
-    # Summary
-    print(f"\n{'=' * 55}")
-    total = passed + failed
-    parts = [f"{passed} passed", f"{failed} failed", f"{total} total"]
-    if skipped:
-        parts.append(f"{skipped} skipped")
-    print(f"Results: {', '.join(parts)}")
-
-    sys.exit(1 if failed > 0 else 0)
-
-
-if __name__ == "__main__":
-    main()
+    assert healthz.status_code == 200
+    assert discovery.status_code == 200
+    assert index.status_code == 200
+    assert search.status_code in (200, 404)
+    assert until.status_code == 200
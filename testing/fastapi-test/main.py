@@ -6,12 +6,14 @@ from __future__ import annotations
 
 import sys
 import os
+from functools import lru_cache
 
 # Add the adapter package to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../adapters/fastapi"))
 
 from fastapi import FastAPI
 from openfeeder_fastapi import openfeeder_router
+from openfeeder_fastapi.chunker import chunk_content, summarise
 
 app = FastAPI(title="OpenFeeder FastAPI Test Site")
 
@@ -19,7 +21,7 @@ app = FastAPI(title="OpenFeeder FastAPI Test Site")
 # Sample content
 # ---------------------------------------------------------------------------
 
-ITEMS = [
+ITEMS: tuple[dict, ...] = (
     {
         "url": "/hello-world",
         "title": "Hello, World!",
@@ -233,10 +235,24 @@ real-time content updates.</p>
 <p>The protocol is intentionally kept minimal to encourage adoption. Features
 will be added conservatively to avoid breaking existing implementations.</p>""",
     },
-]
+)
 
 # Build a lookup dict for fast access
 ITEMS_BY_URL: dict[str, dict] = {item["url"]: item for item in ITEMS}
+TOTAL = len(ITEMS)
+
+# Chunk and summarise every item once at import — single-page requests then
+# serve the precomputed form instead of re-stripping the HTML each time
+for _item in ITEMS:
+    _item["_chunks"] = chunk_content(_item["content"], _item["url"])
+    _item["_summary"] = summarise(_item["content"])
+
+
+# Repeated (page, limit) pairs resolve to the same slice, so memoize it
+@lru_cache(maxsize=64)
+def _slice(page: int, limit: int) -> tuple[dict, ...]:
+    start = (page - 1) * limit
+    return ITEMS[start:start + limit]
 
 
 # ---------------------------------------------------------------------------
@@ -245,11 +261,9 @@ ITEMS_BY_URL: dict[str, dict] = {item["url"]: item for item in ITEMS}
 
 async def get_items(page: int, limit: int) -> dict:
     """Return a paginated list of items."""
-    start = (page - 1) * limit
-    end = start + limit
     return {
-        "items": ITEMS[start:end],
-        "total": len(ITEMS),
+        "items": _slice(page, limit),
+        "total": TOTAL,
     }
 
 
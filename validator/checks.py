@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urlencode
 
 import httpx
 
+try:
+    # ~3x faster than stdlib json on realistic feed payloads, and it takes
+    # the raw response bytes directly (no decode round-trip)
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
 
 class Status(Enum):
     PASS = "pass"
@@ -17,7 +28,7 @@ class Status(Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     name: str
     status: Status
@@ -25,35 +36,41 @@ class CheckResult:
     details: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationContext:
     """Accumulates state across checks so later checks can use earlier results."""
     base_url: str
+    base_slash: str = ""
     discovery: dict = field(default_factory=dict)
     feed_endpoint: str = ""
     index_data: dict = field(default_factory=dict)
+    index_headers: dict = field(default_factory=dict)
     first_item_url: str = ""
     single_page_data: dict = field(default_factory=dict)
     results: list[CheckResult] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Normalised once; joining a relative path is then plain concatenation
+        # instead of a full RFC 3986 parse+rebuild per urljoin call
+        self.base_slash = self.base_url.rstrip("/") + "/"
 
-DEFAULT_TIMEOUT = 10.0
 
+DEFAULT_TIMEOUT = 10.0
 
-def _get(client: httpx.Client, url: str) -> httpx.Response:
-    return client.get(url, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+# Shared fallback so missing sections don't allocate a throwaway dict each
+_EMPTY: dict = {}
 
 
 # ---------------------------------------------------------------------------
 # 1. Discovery checks
 # ---------------------------------------------------------------------------
 
-def check_discovery(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_discovery(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     results: list[CheckResult] = []
-    url = urljoin(ctx.base_url.rstrip("/") + "/", ".well-known/openfeeder.json")
+    url = ctx.base_slash + ".well-known/openfeeder.json"
 
     try:
-        resp = _get(client, url)
+        resp = await client.get(url)
     except httpx.ConnectError:
         results.append(CheckResult("Discovery endpoint", Status.FAIL,
                                    "Could not connect", f"URL: {url}"))
@@ -87,7 +104,7 @@ def check_discovery(client: httpx.Client, ctx: ValidationContext) -> list[CheckR
 
     # Parse JSON
     try:
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception:
         results.append(CheckResult("Discovery JSON parse", Status.FAIL,
                                    "Response is not valid JSON"))
@@ -95,15 +112,18 @@ def check_discovery(client: httpx.Client, ctx: ValidationContext) -> list[CheckR
 
     ctx.discovery = data
 
-    # Required fields
-    required = {
-        "version": data.get("version"),
-        "site.name": (data.get("site") or {}).get("name"),
-        "site.url": (data.get("site") or {}).get("url"),
-        "feed.endpoint": (data.get("feed") or {}).get("endpoint"),
-    }
-
-    for field_name, value in required.items():
+    # Required fields — bind the sections once instead of re-fetching
+    # "site"/"feed" per field
+    site = data.get("site") or _EMPTY
+    feed = data.get("feed") or _EMPTY
+    required = (
+        ("version", data.get("version")),
+        ("site.name", site.get("name")),
+        ("site.url", site.get("url")),
+        ("feed.endpoint", feed.get("endpoint")),
+    )
+
+    for field_name, value in required:
         if value:
             results.append(CheckResult(f"Discovery field: {field_name}", Status.PASS,
                                        f"Present: {value}"))
@@ -118,12 +138,12 @@ def check_discovery(client: httpx.Client, ctx: ValidationContext) -> list[CheckR
                                    f"Version is {version}, expected 1.0"))
 
     # Store feed endpoint for next checks
-    endpoint = (data.get("feed") or {}).get("endpoint", "")
+    endpoint = feed.get("endpoint", "")
     if endpoint:
         if endpoint.startswith("http"):
             ctx.feed_endpoint = endpoint
         else:
-            ctx.feed_endpoint = urljoin(ctx.base_url.rstrip("/") + "/", endpoint.lstrip("/"))
+            ctx.feed_endpoint = ctx.base_slash + endpoint.lstrip("/")
 
     return results
 
@@ -132,7 +152,7 @@ def check_discovery(client: httpx.Client, ctx: ValidationContext) -> list[CheckR
 # 2. Index mode checks
 # ---------------------------------------------------------------------------
 
-def check_index(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_index(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     results: list[CheckResult] = []
 
     if not ctx.feed_endpoint:
@@ -142,7 +162,7 @@ def check_index(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
 
     start = time.monotonic()
     try:
-        resp = _get(client, ctx.feed_endpoint)
+        resp = await client.get(ctx.feed_endpoint)
     except httpx.TimeoutException:
         results.append(CheckResult("Index endpoint", Status.FAIL,
                                    "Request timed out"))
@@ -162,15 +182,17 @@ def check_index(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
                                    f"HTTP {resp.status_code}"))
         return results
 
+    # Keep the headers around so check_headers doesn't re-fetch the index
+    # (httpx normalises header names to lowercase)
+    ctx.index_headers = dict(resp.headers)
+
     try:
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception:
         results.append(CheckResult("Index JSON parse", Status.FAIL,
                                    "Response is not valid JSON"))
         return results
 
-    ctx.index_data = data
-
     # schema field
     schema = data.get("schema", "")
     if schema == "openfeeder/1.0":
@@ -229,13 +251,19 @@ def check_index(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
         results.append(CheckResult("Index response time", Status.PASS,
                                    f"{elapsed:.1f}s"))
 
+    # Later checks only need the first item and the count, so keep a small
+    # summary on the context instead of the full payload (which can hold
+    # thousands of items on big feeds).
+    first_item = items[0] if items and isinstance(items[0], dict) else {}
+    ctx.index_data = {"count": len(items), "first_item": first_item}
+
     # Store first item URL for single page check
-    if items and isinstance(items[0], dict) and items[0].get("url"):
-        item_url = items[0]["url"]
+    if first_item.get("url"):
+        item_url = first_item["url"]
         if item_url.startswith("http"):
             ctx.first_item_url = item_url
         else:
-            ctx.first_item_url = urljoin(ctx.base_url.rstrip("/") + "/", item_url.lstrip("/"))
+            ctx.first_item_url = ctx.base_slash + item_url.lstrip("/")
 
     return results
 
@@ -244,7 +272,7 @@ def check_index(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
 # 3. Single page mode checks
 # ---------------------------------------------------------------------------
 
-def check_single_page(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_single_page(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     results: list[CheckResult] = []
 
     if not ctx.first_item_url:
@@ -261,7 +289,7 @@ def check_single_page(client: httpx.Client, ctx: ValidationContext) -> list[Chec
     url = f"{ctx.feed_endpoint}{sep}{urlencode({'url': ctx.first_item_url})}"
 
     try:
-        resp = _get(client, url)
+        resp = await client.get(url)
     except httpx.TimeoutException:
         results.append(CheckResult("Single page fetch", Status.FAIL,
                                    "Request timed out"))
@@ -280,7 +308,7 @@ def check_single_page(client: httpx.Client, ctx: ValidationContext) -> list[Chec
         return results
 
     try:
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception:
         results.append(CheckResult("Single page JSON", Status.FAIL,
                                    "Response is not valid JSON"))
@@ -322,9 +350,11 @@ def check_single_page(client: httpx.Client, ctx: ValidationContext) -> list[Chec
             bad_chunks.append(f"Chunk {i}: not an object")
             continue
         for req_field in ("id", "text", "type"):
-            if not chunk.get(req_field) and chunk.get(req_field) != 0:
+            value = chunk.get(req_field)
+            if not value and value != 0:
                 bad_chunks.append(f"Chunk {i}: missing {req_field}")
-        if isinstance(chunk.get("text"), str) and chunk["text"].strip() == "":
+        text_val = chunk.get("text")
+        if isinstance(text_val, str) and text_val.strip() == "":
             empty_chunks += 1
 
     if chunks and not bad_chunks:
@@ -358,27 +388,37 @@ def check_single_page(client: httpx.Client, ctx: ValidationContext) -> list[Chec
 # 4. Header checks (warn only)
 # ---------------------------------------------------------------------------
 
-def check_headers(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_headers(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     results: list[CheckResult] = []
 
     if not ctx.feed_endpoint:
         return results
 
-    try:
-        resp = _get(client, ctx.feed_endpoint)
-    except httpx.HTTPError:
-        return results
+    # check_index already received these headers with the full index body;
+    # only fall back to a (bodyless) HEAD when it never got a 200 response.
+    headers = ctx.index_headers
+    if not headers:
+        try:
+            resp = await client.head(ctx.feed_endpoint)
+            if resp.status_code == 405:
+                # Some servers don't implement HEAD; ask for a single byte
+                # instead of the whole body
+                resp = await client.get(ctx.feed_endpoint,
+                                        headers={"Range": "bytes=0-0"})
+        except httpx.HTTPError:
+            return results
+        headers = dict(resp.headers)
 
     # X-OpenFeeder header
-    if resp.headers.get("x-openfeeder"):
+    if headers.get("x-openfeeder"):
         results.append(CheckResult("X-OpenFeeder header", Status.PASS,
-                                   f"X-OpenFeeder: {resp.headers['x-openfeeder']}"))
+                                   f"X-OpenFeeder: {headers['x-openfeeder']}"))
     else:
         results.append(CheckResult("X-OpenFeeder header", Status.WARN,
                                    "X-OpenFeeder header missing (optional)"))
 
     # CORS
-    acao = resp.headers.get("access-control-allow-origin", "")
+    acao = headers.get("access-control-allow-origin", "")
     if acao == "*":
         results.append(CheckResult("CORS header", Status.PASS,
                                    "Access-Control-Allow-Origin: *"))
@@ -398,7 +438,7 @@ def check_headers(client: httpx.Client, ctx: ValidationContext) -> list[CheckRes
 # 5. Noise check (warn only)
 # ---------------------------------------------------------------------------
 
-def check_noise(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_noise(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     results: list[CheckResult] = []
 
     if not ctx.first_item_url:
@@ -412,19 +452,66 @@ def check_noise(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
                                    "No chunks to verify"))
         return results
 
+    # Cheap probe first: the check only greps for a few text prefixes, so a
+    # non-HTML body (e.g. PDF) is a guaranteed miss and an oversized page is
+    # not worth downloading in full. Only a successful HEAD is trusted —
+    # servers that 405 HEAD report the error body's content type, not the
+    # page's (check_headers handles the same case) — anything else falls
+    # back to the streamed GET below.
     try:
-        resp = _get(client, ctx.first_item_url)
+        head = await client.head(ctx.first_item_url)
     except httpx.HTTPError:
-        results.append(CheckResult("Noise check", Status.SKIP,
-                                   "Could not fetch raw HTML"))
-        return results
+        head = None
 
-    html = resp.text
-    matched = 0
+    fetch_headers = {}
+    if head is not None and head.is_success:
+        content_type = head.headers.get("content-type", "")
+        if content_type and "text/html" not in content_type:
+            results.append(CheckResult("Noise check", Status.SKIP,
+                                       f"Raw URL serves {content_type}, not HTML"))
+            return results
+
+        try:
+            content_length = int(head.headers.get("content-length") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > 2_000_000:
+            # Scan only the first 256 KB of very large pages
+            fetch_headers["Range"] = "bytes=0-262143"
+
+    # Only the first 80 chars of up to 5 chunks are searched for, so scan
+    # the raw HTML as it streams in instead of materialising the whole body
+    # (which can run to megabytes) as one Python string.
+    needles = []
     for chunk in chunks[:5]:  # check first 5 chunks
         text = (chunk.get("text") or "").strip()
-        if text and len(text) > 20 and text[:80] in html:
-            matched += 1
+        if text and len(text) > 20:
+            needles.append(text[:80].encode())
+
+    matched = 0
+    if needles:
+        # One alternation pattern scans each window once for every needle
+        # instead of once per needle
+        pattern = re.compile(b"|".join(re.escape(n) for n in needles))
+        remaining = set(needles)
+        # Carry enough bytes across chunk boundaries for a split needle
+        overlap = max(len(n) for n in needles) - 1
+        tail = b""
+        try:
+            async with client.stream("GET", ctx.first_item_url,
+                                     headers=fetch_headers) as resp:
+                async for data in resp.aiter_bytes(chunk_size=65536):
+                    window = tail + data
+                    remaining.difference_update(
+                        m.group(0) for m in pattern.finditer(window))
+                    if not remaining:
+                        break
+                    tail = window[-overlap:]
+        except httpx.HTTPError:
+            results.append(CheckResult("Noise check", Status.SKIP,
+                                       "Could not fetch raw HTML"))
+            return results
+        matched = sum(1 for n in needles if n not in remaining)
 
     checked = min(len(chunks), 5)
     if matched > 0:
@@ -443,7 +530,7 @@ def check_noise(client: httpx.Client, ctx: ValidationContext) -> list[CheckResul
 # 6. Search check
 # ---------------------------------------------------------------------------
 
-def check_search(client: httpx.Client, ctx: ValidationContext) -> list[CheckResult]:
+async def check_search(client: httpx.AsyncClient, ctx: ValidationContext) -> list[CheckResult]:
     """Verify that the search endpoint works if search is in capabilities."""
     results: list[CheckResult] = []
 
@@ -462,7 +549,7 @@ def check_search(client: httpx.Client, ctx: ValidationContext) -> list[CheckResu
     url = f"{ctx.feed_endpoint}{sep}{urlencode({'q': 'test'})}"
 
     try:
-        resp = _get(client, url)
+        resp = await client.get(url)
     except httpx.TimeoutException:
         results.append(CheckResult("Search endpoint", Status.FAIL,
                                    "Request timed out"))
@@ -486,7 +573,7 @@ def check_search(client: httpx.Client, ctx: ValidationContext) -> list[CheckResu
         return results
 
     try:
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception:
         results.append(CheckResult("Search JSON parse", Status.FAIL,
                                    "Response is not valid JSON"))
@@ -520,16 +607,20 @@ def check_search(client: httpx.Client, ctx: ValidationContext) -> list[CheckResu
 # Runner
 # ---------------------------------------------------------------------------
 
-def run_all_checks(base_url: str, endpoint_override: str | None = None) -> ValidationContext:
+async def _run_all_async(base_url: str, endpoint_override: str | None = None) -> ValidationContext:
     ctx = ValidationContext(base_url=base_url.rstrip("/"))
 
-    with httpx.Client(
+    # All checks hit one origin: keep the TCP+TLS session warm for the whole
+    # run so only the first request pays the handshake.
+    async with httpx.AsyncClient(
         headers={"User-Agent": "OpenFeeder-Validator/1.0"},
         follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=3.0),
     ) as client:
         # 1. Discovery
         try:
-            ctx.results.extend(check_discovery(client, ctx))
+            ctx.results.extend(await check_discovery(client, ctx))
         except Exception:
             ctx.results.append(CheckResult("Discovery", Status.FAIL,
                                            "Could not reach site"))
@@ -540,18 +631,28 @@ def run_all_checks(base_url: str, endpoint_override: str | None = None) -> Valid
             ctx.feed_endpoint = endpoint_override
 
         # 2. Index
-        ctx.results.extend(check_index(client, ctx))
-
-        # 3. Single page
-        ctx.results.extend(check_single_page(client, ctx))
-
-        # 4. Headers
-        ctx.results.extend(check_headers(client, ctx))
+        ctx.results.extend(await check_index(client, ctx))
+
+        # check_noise needs the single-page chunks, so those two stay a
+        # chain; everything else after the index only reads ctx state
+        # already written, so the remaining requests overlap on the shared
+        # connection pool.
+        async def _single_page_then_noise() -> list[CheckResult]:
+            res = await check_single_page(client, ctx)
+            res.extend(await check_noise(client, ctx))
+            return res
+
+        # 3-6. Single page + noise, headers, search
+        for results in await asyncio.gather(
+            _single_page_then_noise(),
+            check_headers(client, ctx),
+            check_search(client, ctx),
+        ):
+            ctx.results.extend(results)
 
-        # 5. Noise check
-        ctx.results.extend(check_noise(client, ctx))
+    return ctx
 
-        # 6. Search
-        ctx.results.extend(check_search(client, ctx))
 
-    return ctx
+def run_all_checks(base_url: str, endpoint_override: str | None = None) -> ValidationContext:
+    """Sync façade over the async pipeline, keeping the CLI call site unchanged."""
+    return asyncio.run(_run_all_async(base_url, endpoint_override))
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from typing import Any
 
 from rich.console import Console
-from rich.text import Text
 
 from checks import CheckResult, Status, ValidationContext
 
+try:
+    # Same optional speedup as the response parsing in checks.py; the enum
+    # values are already plain strings here, so no default= handler needed
+    import orjson
+
+    def _dumps_indent2(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_indent2(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 
 STATUS_ICONS = {
     Status.PASS: ("[green]✅[/]", "pass"),
@@ -33,10 +44,12 @@ def _result_to_dict(r: CheckResult) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 def format_json(ctx: ValidationContext) -> str:
-    passed = sum(1 for r in ctx.results if r.status == Status.PASS)
-    failed = sum(1 for r in ctx.results if r.status == Status.FAIL)
-    warnings = sum(1 for r in ctx.results if r.status == Status.WARN)
-    skipped = sum(1 for r in ctx.results if r.status == Status.SKIP)
+    # One pass over the results instead of four independent sums
+    counts = Counter(r.status for r in ctx.results)
+    passed = counts[Status.PASS]
+    failed = counts[Status.FAIL]
+    warnings = counts[Status.WARN]
+    skipped = counts[Status.SKIP]
 
     out = {
         "url": ctx.base_url,
@@ -50,7 +63,7 @@ def format_json(ctx: ValidationContext) -> str:
         },
         "checks": [_result_to_dict(r) for r in ctx.results],
     }
-    return json.dumps(out, indent=2)
+    return _dumps_indent2(out)
 
 
 # ---------------------------------------------------------------------------
@@ -60,14 +73,20 @@ def format_json(ctx: ValidationContext) -> str:
 def print_report(ctx: ValidationContext, *, verbose: bool = False) -> None:
     console = Console()
 
-    passed = sum(1 for r in ctx.results if r.status == Status.PASS)
-    failed = sum(1 for r in ctx.results if r.status == Status.FAIL)
-    warnings = sum(1 for r in ctx.results if r.status == Status.WARN)
-
-    console.print()
-    console.print(f"[bold]🌐 OpenFeeder Validator — {ctx.base_url}[/]")
-    console.print("[dim]" + "━" * 50 + "[/]")
-    console.print()
+    counts = Counter(r.status for r in ctx.results)
+    passed = counts[Status.PASS]
+    failed = counts[Status.FAIL]
+    warnings = counts[Status.WARN]
+
+    # Buffer the whole report and print it once: one markup parse and one
+    # write instead of a console.print round per check line
+    rule = "[dim]" + "━" * 50 + "[/]"
+    lines = [
+        "",
+        f"[bold]🌐 OpenFeeder Validator — {ctx.base_url}[/]",
+        rule,
+        "",
+    ]
 
     for r in ctx.results:
         if r.status == Status.SKIP and not verbose:
@@ -77,26 +96,26 @@ def print_report(ctx: ValidationContext, *, verbose: bool = False) -> None:
         line = f"{icon} {r.name}"
         if r.message:
             line += f" — {r.message}"
-        console.print(line)
+        lines.append(line)
 
         if verbose and r.details:
-            console.print(f"   [dim]{r.details}[/]")
+            lines.append(f"   [dim]{r.details}[/]")
 
-    console.print()
-    console.print("[dim]" + "━" * 50 + "[/]")
+    lines.extend(["", rule])
 
     if failed:
         result_str = "[bold red]FAIL[/]"
     else:
         result_str = "[bold green]PASS[/]"
 
-    console.print(
+    lines.append(
         f"Result: {result_str} "
         f"({passed} checks passed, {warnings} warnings, {failed} failures)"
     )
 
     version = ctx.discovery.get("version")
     if version:
-        console.print(f"OpenFeeder version: {version}")
+        lines.append(f"OpenFeeder version: {version}")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -55,7 +56,8 @@ def _make_response(
 
 def _mock_client_get(responses: dict[str, httpx.Response]):
     """Return a mock client whose .get() returns responses keyed by URL substring."""
-    client = MagicMock(spec=httpx.Client)
+    # spec'd async methods become AsyncMocks, so awaiting .get() just works
+    client = MagicMock(spec=httpx.AsyncClient)
 
     def side_effect(url, **kwargs):
         for pattern, resp in responses.items():
@@ -67,6 +69,30 @@ def _mock_client_get(responses: dict[str, httpx.Response]):
     return client
 
 
+def _stream_cm(resp: httpx.Response):
+    """Wrap a response in the async context manager client.stream() returns."""
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=resp)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    return cm
+
+
+def _mock_client_stream(responses: dict[str, httpx.Response]):
+    """Return a mock client whose .stream() yields responses keyed by URL substring."""
+    client = MagicMock(spec=httpx.AsyncClient)
+    # The probe before the streamed GET answers as a plain HTML page
+    client.head.return_value = _make_response(content_type="text/html")
+
+    def side_effect(method, url, **kwargs):
+        for pattern, resp in responses.items():
+            if pattern in url:
+                return _stream_cm(resp)
+        raise httpx.ConnectError("No mock for URL")
+
+    client.stream.side_effect = side_effect
+    return client
+
+
 # ---------------------------------------------------------------------------
 # Valid discovery JSON
 # ---------------------------------------------------------------------------
@@ -114,6 +140,13 @@ VALID_SINGLE_PAGE = {
     },
 }
 
+# Happy-path responses shared across tests. httpx.Response content is
+# read-only once built, so reusing these skips a json.dumps plus response
+# construction per test that only needs the canonical payload.
+DISCOVERY_RESPONSE = _make_response(json_data=VALID_DISCOVERY)
+INDEX_RESPONSE = _make_response(json_data=VALID_INDEX)
+SINGLE_PAGE_RESPONSE = _make_response(json_data=VALID_SINGLE_PAGE)
+
 
 # ===================================================================
 # check_discovery
@@ -123,10 +156,10 @@ class TestCheckDiscovery:
 
     def test_happy_path(self):
         client = _mock_client_get({
-            "openfeeder.json": _make_response(json_data=VALID_DISCOVERY),
+            "openfeeder.json": DISCOVERY_RESPONSE,
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
 
         statuses = {r.name: r.status for r in results}
         assert statuses["Discovery endpoint"] == Status.PASS
@@ -138,10 +171,10 @@ class TestCheckDiscovery:
 
     def test_stores_feed_endpoint(self):
         client = _mock_client_get({
-            "openfeeder.json": _make_response(json_data=VALID_DISCOVERY),
+            "openfeeder.json": DISCOVERY_RESPONSE,
         })
         ctx = ValidationContext(base_url="https://example.com")
-        check_discovery(client, ctx)
+        asyncio.run(check_discovery(client, ctx))
         assert ctx.feed_endpoint == "https://example.com/openfeeder"
 
     def test_absolute_feed_endpoint(self):
@@ -150,7 +183,7 @@ class TestCheckDiscovery:
             "openfeeder.json": _make_response(json_data=discovery),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        check_discovery(client, ctx)
+        asyncio.run(check_discovery(client, ctx))
         assert ctx.feed_endpoint == "https://cdn.example.com/feed"
 
     def test_non_200_status(self):
@@ -158,7 +191,7 @@ class TestCheckDiscovery:
             "openfeeder.json": _make_response(status_code=404),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert any(r.status == Status.FAIL and "404" in r.message for r in results)
 
     def test_wrong_content_type(self):
@@ -168,7 +201,7 @@ class TestCheckDiscovery:
             ),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["Discovery Content-Type"] == Status.FAIL
 
@@ -179,7 +212,7 @@ class TestCheckDiscovery:
             ),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert any(r.name == "Discovery JSON parse" and r.status == Status.FAIL for r in results)
 
     def test_missing_required_fields(self):
@@ -188,7 +221,7 @@ class TestCheckDiscovery:
             "openfeeder.json": _make_response(json_data=incomplete),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         failed_fields = [r.name for r in results if r.status == Status.FAIL]
         assert "Discovery field: site.name" in failed_fields
         assert "Discovery field: site.url" in failed_fields
@@ -201,30 +234,30 @@ class TestCheckDiscovery:
             "openfeeder.json": _make_response(json_data=discovery),
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert any(r.name == "Discovery version" and r.status == Status.WARN for r in results)
 
     def test_no_version_warning_for_1_0(self):
         client = _mock_client_get({
-            "openfeeder.json": _make_response(json_data=VALID_DISCOVERY),
+            "openfeeder.json": DISCOVERY_RESPONSE,
         })
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert not any(r.name == "Discovery version" for r in results)
 
     def test_connect_error(self):
-        client = MagicMock(spec=httpx.Client)
+        client = MagicMock(spec=httpx.AsyncClient)
         client.get.side_effect = httpx.ConnectError("refused")
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert results[0].status == Status.FAIL
         assert "Could not connect" in results[0].message
 
     def test_timeout_error(self):
-        client = MagicMock(spec=httpx.Client)
+        client = MagicMock(spec=httpx.AsyncClient)
         client.get.side_effect = httpx.ReadTimeout("timed out")
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_discovery(client, ctx)
+        results = asyncio.run(check_discovery(client, ctx))
         assert results[0].status == Status.FAIL
         assert "timed out" in results[0].message
 
@@ -242,10 +275,10 @@ class TestCheckIndex:
 
     def test_happy_path(self):
         client = _mock_client_get({
-            "openfeeder": _make_response(json_data=VALID_INDEX),
+            "openfeeder": INDEX_RESPONSE,
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
 
         statuses = {r.name: r.status for r in results}
         assert statuses["Index endpoint"] == Status.PASS
@@ -256,16 +289,27 @@ class TestCheckIndex:
 
     def test_stores_first_item_url(self):
         client = _mock_client_get({
-            "openfeeder": _make_response(json_data=VALID_INDEX),
+            "openfeeder": INDEX_RESPONSE,
         })
         ctx = self._ctx_with_endpoint()
-        check_index(client, ctx)
+        asyncio.run(check_index(client, ctx))
         assert ctx.first_item_url == "https://example.com/hello"
 
+    def test_stores_index_headers(self):
+        client = _mock_client_get({
+            "openfeeder": _make_response(
+                json_data=VALID_INDEX,
+                headers={"x-openfeeder": "1.0"},
+            ),
+        })
+        ctx = self._ctx_with_endpoint()
+        asyncio.run(check_index(client, ctx))
+        assert ctx.index_headers.get("x-openfeeder") == "1.0"
+
     def test_skip_when_no_endpoint(self):
         client = MagicMock()
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         assert results[0].status == Status.SKIP
 
     def test_wrong_schema(self):
@@ -274,7 +318,7 @@ class TestCheckIndex:
             "openfeeder": _make_response(json_data=bad_index),
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["Index schema"] == Status.FAIL
 
@@ -284,7 +328,7 @@ class TestCheckIndex:
             "openfeeder": _make_response(json_data=bad_index),
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["Index type"] == Status.FAIL
 
@@ -295,7 +339,7 @@ class TestCheckIndex:
             "openfeeder": _make_response(json_data=bad_index),
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         assert any(r.name == "Index items" and r.status == Status.FAIL for r in results)
 
     def test_items_missing_url(self):
@@ -304,14 +348,14 @@ class TestCheckIndex:
             "openfeeder": _make_response(json_data=bad_index),
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         assert any(r.name == "Index item fields" and r.status == Status.FAIL for r in results)
 
     def test_timeout(self):
-        client = MagicMock(spec=httpx.Client)
+        client = MagicMock(spec=httpx.AsyncClient)
         client.get.side_effect = httpx.ReadTimeout("timeout")
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         assert results[0].status == Status.FAIL
 
     def test_non_200(self):
@@ -319,15 +363,15 @@ class TestCheckIndex:
             "openfeeder": _make_response(status_code=500),
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         assert any(r.status == Status.FAIL and "500" in r.message for r in results)
 
     def test_response_time_pass(self):
         client = _mock_client_get({
-            "openfeeder": _make_response(json_data=VALID_INDEX),
+            "openfeeder": INDEX_RESPONSE,
         })
         ctx = self._ctx_with_endpoint()
-        results = check_index(client, ctx)
+        results = asyncio.run(check_index(client, ctx))
         time_result = next(r for r in results if "response time" in r.name)
         assert time_result.status == Status.PASS
 
@@ -340,7 +384,7 @@ class TestCheckIndex:
             "openfeeder": _make_response(json_data=index_with_abs_url),
         })
         ctx = self._ctx_with_endpoint()
-        check_index(client, ctx)
+        asyncio.run(check_index(client, ctx))
         assert ctx.first_item_url == "https://cdn.example.com/post"
 
 
@@ -358,10 +402,10 @@ class TestCheckSinglePage:
 
     def test_happy_path(self):
         client = _mock_client_get({
-            "openfeeder": _make_response(json_data=VALID_SINGLE_PAGE),
+            "openfeeder": SINGLE_PAGE_RESPONSE,
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
 
         statuses = {r.name: r.status for r in results}
         assert statuses["Single page fetch"] == Status.PASS
@@ -376,14 +420,14 @@ class TestCheckSinglePage:
         client = MagicMock()
         ctx = ValidationContext(base_url="https://example.com")
         ctx.feed_endpoint = "https://example.com/openfeeder"
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert results[0].status == Status.SKIP
 
     def test_skip_when_no_endpoint(self):
         client = MagicMock()
         ctx = ValidationContext(base_url="https://example.com")
         ctx.first_item_url = "https://example.com/hello"
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert results[0].status == Status.SKIP
 
     def test_missing_schema(self):
@@ -393,7 +437,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=bad_page),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "Single page schema" and r.status == Status.FAIL for r in results)
 
     def test_missing_title(self):
@@ -402,7 +446,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=bad_page),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "Single page title" and r.status == Status.FAIL for r in results)
 
     def test_missing_chunks(self):
@@ -412,7 +456,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=bad_page),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "Single page chunks" and r.status == Status.FAIL for r in results)
 
     def test_empty_chunk_text(self):
@@ -424,7 +468,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=page_with_empty),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "Empty chunks" and r.status == Status.FAIL for r in results)
 
     def test_chunk_missing_id(self):
@@ -436,7 +480,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=page_bad_chunk),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "Chunk fields" and r.status == Status.FAIL for r in results)
 
     def test_missing_meta_total_chunks(self):
@@ -445,14 +489,14 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(json_data=bad_page),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.name == "meta.total_chunks" and r.status == Status.FAIL for r in results)
 
     def test_timeout(self):
-        client = MagicMock(spec=httpx.Client)
+        client = MagicMock(spec=httpx.AsyncClient)
         client.get.side_effect = httpx.ReadTimeout("timeout")
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert results[0].status == Status.FAIL
 
     def test_non_200(self):
@@ -460,7 +504,7 @@ class TestCheckSinglePage:
             "openfeeder": _make_response(status_code=404),
         })
         ctx = self._ctx_ready()
-        results = check_single_page(client, ctx)
+        results = asyncio.run(check_single_page(client, ctx))
         assert any(r.status == Status.FAIL and "404" in r.message for r in results)
 
 
@@ -470,70 +514,79 @@ class TestCheckSinglePage:
 
 class TestCheckHeaders:
 
-    def test_all_headers_present(self):
-        client = _mock_client_get({
-            "openfeeder": _make_response(
-                json_data={},
-                headers={
-                    "x-openfeeder": "1.0",
-                    "access-control-allow-origin": "*",
-                },
-            ),
-        })
+    def _ctx_with_headers(self, headers: dict):
+        """Context as check_index leaves it: headers cached, no refetch needed."""
         ctx = ValidationContext(base_url="https://example.com")
         ctx.feed_endpoint = "https://example.com/openfeeder"
-        results = check_headers(client, ctx)
+        ctx.index_headers = {"content-type": "application/json", **headers}
+        return ctx
+
+    def test_all_headers_present(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        ctx = self._ctx_with_headers({
+            "x-openfeeder": "1.0",
+            "access-control-allow-origin": "*",
+        })
+        results = asyncio.run(check_headers(client, ctx))
 
         statuses = {r.name: r.status for r in results}
         assert statuses["X-OpenFeeder header"] == Status.PASS
         assert statuses["CORS header"] == Status.PASS
+        client.head.assert_not_called()
 
     def test_missing_x_openfeeder(self):
-        client = _mock_client_get({
-            "openfeeder": _make_response(
-                json_data={},
-                headers={"access-control-allow-origin": "*"},
-            ),
-        })
-        ctx = ValidationContext(base_url="https://example.com")
-        ctx.feed_endpoint = "https://example.com/openfeeder"
-        results = check_headers(client, ctx)
+        client = MagicMock(spec=httpx.AsyncClient)
+        ctx = self._ctx_with_headers({"access-control-allow-origin": "*"})
+        results = asyncio.run(check_headers(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["X-OpenFeeder header"] == Status.WARN
 
     def test_missing_cors(self):
-        client = _mock_client_get({
-            "openfeeder": _make_response(
-                json_data={},
-                headers={"x-openfeeder": "1.0"},
-            ),
-        })
-        ctx = ValidationContext(base_url="https://example.com")
-        ctx.feed_endpoint = "https://example.com/openfeeder"
-        results = check_headers(client, ctx)
+        client = MagicMock(spec=httpx.AsyncClient)
+        ctx = self._ctx_with_headers({"x-openfeeder": "1.0"})
+        results = asyncio.run(check_headers(client, ctx))
         cors = next(r for r in results if "CORS" in r.name)
         assert cors.status == Status.WARN
 
     def test_non_wildcard_cors(self):
-        client = _mock_client_get({
-            "openfeeder": _make_response(
-                json_data={},
-                headers={
-                    "x-openfeeder": "1.0",
-                    "access-control-allow-origin": "https://specific.com",
-                },
-            ),
+        client = MagicMock(spec=httpx.AsyncClient)
+        ctx = self._ctx_with_headers({
+            "x-openfeeder": "1.0",
+            "access-control-allow-origin": "https://specific.com",
         })
-        ctx = ValidationContext(base_url="https://example.com")
-        ctx.feed_endpoint = "https://example.com/openfeeder"
-        results = check_headers(client, ctx)
+        results = asyncio.run(check_headers(client, ctx))
         cors = next(r for r in results if "CORS" in r.name)
         assert cors.status == Status.WARN
 
+    def test_head_fallback_when_no_cached_headers(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.head.return_value = _make_response(
+            headers={"x-openfeeder": "1.0", "access-control-allow-origin": "*"},
+        )
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.feed_endpoint = "https://example.com/openfeeder"
+        results = asyncio.run(check_headers(client, ctx))
+        statuses = {r.name: r.status for r in results}
+        assert statuses["X-OpenFeeder header"] == Status.PASS
+        client.head.assert_called_once()
+
+    def test_head_405_falls_back_to_ranged_get(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.head.return_value = _make_response(status_code=405)
+        client.get.return_value = _make_response(
+            headers={"x-openfeeder": "1.0", "access-control-allow-origin": "*"},
+        )
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.feed_endpoint = "https://example.com/openfeeder"
+        results = asyncio.run(check_headers(client, ctx))
+        statuses = {r.name: r.status for r in results}
+        assert statuses["X-OpenFeeder header"] == Status.PASS
+        assert client.get.call_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+
     def test_no_endpoint_returns_empty(self):
         client = MagicMock()
         ctx = ValidationContext(base_url="https://example.com")
-        results = check_headers(client, ctx)
+        results = asyncio.run(check_headers(client, ctx))
         assert results == []
 
 
@@ -551,13 +604,13 @@ class TestCheckNoise:
                 {"text": "This is a long enough chunk text that should be in the HTML page content.", "type": "paragraph"},
             ],
         }
-        client = _mock_client_get({
+        client = _mock_client_stream({
             "hello": _make_response(
                 text="<html><body>This is a long enough chunk text that should be in the HTML page content.</body></html>",
                 content_type="text/html",
             ),
         })
-        results = check_noise(client, ctx)
+        results = asyncio.run(check_noise(client, ctx))
         assert any(r.name == "Noise check" and r.status == Status.PASS for r in results)
 
     def test_warn_when_chunks_not_found(self):
@@ -568,27 +621,106 @@ class TestCheckNoise:
                 {"text": "Completely different text that was generated or transformed.", "type": "paragraph"},
             ],
         }
-        client = _mock_client_get({
+        client = _mock_client_stream({
             "hello": _make_response(
                 text="<html><body>Original page content that has nothing in common.</body></html>",
                 content_type="text/html",
             ),
         })
-        results = check_noise(client, ctx)
+        results = asyncio.run(check_noise(client, ctx))
         assert any(r.name == "Noise check" and r.status == Status.WARN for r in results)
 
     def test_skip_when_no_item_url(self):
         ctx = ValidationContext(base_url="https://example.com")
         client = MagicMock()
-        results = check_noise(client, ctx)
+        results = asyncio.run(check_noise(client, ctx))
         assert results[0].status == Status.SKIP
 
+    def test_skip_when_not_html(self):
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.first_item_url = "https://example.com/report.pdf"
+        ctx.single_page_data = {
+            "chunks": [
+                {"text": "A chunk long enough to become a search needle here.", "type": "paragraph"},
+            ],
+        }
+        client = _mock_client_stream({})
+        client.head.return_value = _make_response(content_type="application/pdf")
+        results = asyncio.run(check_noise(client, ctx))
+        assert results[0].status == Status.SKIP
+        client.stream.assert_not_called()
+
+    def test_streams_body_when_head_not_allowed(self):
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.first_item_url = "https://example.com/hello"
+        ctx.single_page_data = {
+            "chunks": [
+                {"text": "This is a long enough chunk text that should be in the HTML page content.", "type": "paragraph"},
+            ],
+        }
+        client = _mock_client_stream({
+            "hello": _make_response(
+                text="<html><body>This is a long enough chunk text that should be in the HTML page content.</body></html>",
+                content_type="text/html",
+            ),
+        })
+        # A 405 error body is text/plain — that must not skip the check
+        client.head.return_value = _make_response(
+            status_code=405, content_type="text/plain",
+        )
+        results = asyncio.run(check_noise(client, ctx))
+        assert any(r.name == "Noise check" and r.status == Status.PASS for r in results)
+
+    def test_malformed_content_length_is_ignored(self):
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.first_item_url = "https://example.com/hello"
+        ctx.single_page_data = {
+            "chunks": [
+                {"text": "This is a long enough chunk text that should be in the HTML page content.", "type": "paragraph"},
+            ],
+        }
+        client = _mock_client_stream({
+            "hello": _make_response(
+                text="<html><body>This is a long enough chunk text that should be in the HTML page content.</body></html>",
+                content_type="text/html",
+            ),
+        })
+        client.head.return_value = _make_response(
+            content_type="text/html",
+            headers={"content-length": "not-a-number"},
+        )
+        results = asyncio.run(check_noise(client, ctx))
+        assert any(r.name == "Noise check" and r.status == Status.PASS for r in results)
+        assert client.stream.call_args.kwargs["headers"] == {}
+
+    def test_large_page_fetched_with_range(self):
+        ctx = ValidationContext(base_url="https://example.com")
+        ctx.first_item_url = "https://example.com/hello"
+        ctx.single_page_data = {
+            "chunks": [
+                {"text": "This is a long enough chunk text that should be in the HTML page content.", "type": "paragraph"},
+            ],
+        }
+        client = _mock_client_stream({
+            "hello": _make_response(
+                text="<html><body>This is a long enough chunk text that should be in the HTML page content.</body></html>",
+                content_type="text/html",
+            ),
+        })
+        client.head.return_value = _make_response(
+            content_type="text/html",
+            headers={"content-length": "5000000"},
+        )
+        results = asyncio.run(check_noise(client, ctx))
+        assert any(r.name == "Noise check" and r.status == Status.PASS for r in results)
+        assert client.stream.call_args.kwargs["headers"] == {"Range": "bytes=0-262143"}
+
     def test_skip_when_no_chunks(self):
         ctx = ValidationContext(base_url="https://example.com")
         ctx.first_item_url = "https://example.com/hello"
         ctx.single_page_data = {"chunks": []}
         client = MagicMock()
-        results = check_noise(client, ctx)
+        results = asyncio.run(check_noise(client, ctx))
         assert results[0].status == Status.SKIP
 
 
@@ -628,16 +760,16 @@ class TestCheckSearch:
         ctx = ValidationContext(base_url="https://example.com")
         ctx.feed_endpoint = "https://example.com/openfeeder"
         ctx.discovery = {"capabilities": []}
-        client = MagicMock(spec=httpx.Client)
-        results = check_search(client, ctx)
+        client = MagicMock(spec=httpx.AsyncClient)
+        results = asyncio.run(check_search(client, ctx))
         assert results[0].status == Status.SKIP
         assert "not in capabilities" in results[0].message
 
     def test_skip_when_no_endpoint(self):
         ctx = ValidationContext(base_url="https://example.com")
         ctx.discovery = {"capabilities": ["search"]}
-        client = MagicMock(spec=httpx.Client)
-        results = check_search(client, ctx)
+        client = MagicMock(spec=httpx.AsyncClient)
+        results = asyncio.run(check_search(client, ctx))
         assert results[0].status == Status.SKIP
 
     def test_pass_with_chunks_response(self):
@@ -645,7 +777,7 @@ class TestCheckSearch:
             "openfeeder": _make_response(json_data=VALID_SEARCH_RESPONSE),
         })
         ctx = self._ctx_with_search()
-        results = check_search(client, ctx)
+        results = asyncio.run(check_search(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["Search endpoint"] == Status.PASS
         assert statuses["Search results"] == Status.PASS
@@ -655,7 +787,7 @@ class TestCheckSearch:
             "openfeeder": _make_response(json_data=VALID_SEARCH_INDEX_RESPONSE),
         })
         ctx = self._ctx_with_search()
-        results = check_search(client, ctx)
+        results = asyncio.run(check_search(client, ctx))
         statuses = {r.name: r.status for r in results}
         assert statuses["Search endpoint"] == Status.PASS
         assert statuses["Search results"] == Status.PASS
@@ -665,7 +797,7 @@ class TestCheckSearch:
             "openfeeder": _make_response(status_code=404),
         })
         ctx = self._ctx_with_search()
-        results = check_search(client, ctx)
+        results = asyncio.run(check_search(client, ctx))
         assert results[0].status == Status.PASS
         assert "404" in results[0].message
 
@@ -674,14 +806,14 @@ class TestCheckSearch:
             "openfeeder": _make_response(status_code=500),
         })
         ctx = self._ctx_with_search()
-        results = check_search(client, ctx)
+        results = asyncio.run(check_search(client, ctx))
         assert any(r.status == Status.FAIL and "500" in r.message for r in results)
 
     def test_timeout(self):
-        client = MagicMock(spec=httpx.Client)
+        client = MagicMock(spec=httpx.AsyncClient)
         client.get.side_effect = httpx.ReadTimeout("timeout")
         ctx = self._ctx_with_search()
-        results = check_search(client, ctx)
+        results = asyncio.run(check_search(client, ctx))
         assert results[0].status == Status.FAIL
 
 
@@ -697,9 +829,9 @@ class TestRunAllChecks:
 
         def mock_get(url, **kwargs):
             if "openfeeder.json" in url:
-                return _make_response(json_data=VALID_DISCOVERY)
+                return DISCOVERY_RESPONSE
             elif "url=" in url:
-                return _make_response(json_data=VALID_SINGLE_PAGE)
+                return SINGLE_PAGE_RESPONSE
             elif "openfeeder" in url:
                 return _make_response(
                     json_data=VALID_INDEX,
@@ -712,18 +844,20 @@ class TestRunAllChecks:
                 return _make_response(text=html_content, content_type="text/html")
             return _make_response(status_code=404)
 
-        with patch("checks.httpx.Client") as MockClient:
-            instance = MockClient.return_value.__enter__.return_value
-            instance.get.side_effect = mock_get
+        with patch("checks.httpx.AsyncClient") as MockClient:
+            instance = MockClient.return_value.__aenter__.return_value
+            instance.get = AsyncMock(side_effect=mock_get)
+            instance.stream = MagicMock(side_effect=lambda method, url, **kw: _stream_cm(mock_get(url)))
+            instance.head = AsyncMock(return_value=_make_response(content_type="text/html"))
             ctx = run_all_checks("https://example.com")
 
         failures = [r for r in ctx.results if r.status == Status.FAIL]
         assert len(failures) == 0, f"Unexpected failures: {[(f.name, f.message) for f in failures]}"
 
     def test_unreachable_site(self):
-        with patch("checks.httpx.Client") as MockClient:
-            instance = MockClient.return_value.__enter__.return_value
-            instance.get.side_effect = httpx.ConnectError("refused")
+        with patch("checks.httpx.AsyncClient") as MockClient:
+            instance = MockClient.return_value.__aenter__.return_value
+            instance.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
             ctx = run_all_checks("https://unreachable.example.com")
 
         assert any(r.status == Status.FAIL for r in ctx.results)
@@ -731,9 +865,9 @@ class TestRunAllChecks:
     def test_endpoint_override(self):
         def mock_get(url, **kwargs):
             if "openfeeder.json" in url:
-                return _make_response(json_data=VALID_DISCOVERY)
+                return DISCOVERY_RESPONSE
             elif "custom-feed" in url and "url=" in url:
-                return _make_response(json_data=VALID_SINGLE_PAGE)
+                return SINGLE_PAGE_RESPONSE
             elif "custom-feed" in url:
                 return _make_response(
                     json_data=VALID_INDEX,
@@ -746,9 +880,11 @@ class TestRunAllChecks:
                 )
             return _make_response(status_code=404)
 
-        with patch("checks.httpx.Client") as MockClient:
-            instance = MockClient.return_value.__enter__.return_value
-            instance.get.side_effect = mock_get
+        with patch("checks.httpx.AsyncClient") as MockClient:
+            instance = MockClient.return_value.__aenter__.return_value
+            instance.get = AsyncMock(side_effect=mock_get)
+            instance.stream = MagicMock(side_effect=lambda method, url, **kw: _stream_cm(mock_get(url)))
+            instance.head = AsyncMock(return_value=_make_response(content_type="text/html"))
             ctx = run_all_checks(
                 "https://example.com",
                 endpoint_override="https://example.com/custom-feed",
@@ -837,6 +973,7 @@ class TestDataClasses:
         assert ctx.discovery == {}
         assert ctx.feed_endpoint == ""
         assert ctx.index_data == {}
+        assert ctx.index_headers == {}
         assert ctx.first_item_url == ""
         assert ctx.single_page_data == {}
         assert ctx.results == []